@@ -13,7 +13,11 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
 from utils.json_ops import safe_json_load, safe_json_save
+from utils.api_client import get_api_client
+from utils.http_pool import get_http_pool
+from utils.prewarm import get_prewarmer
 from cards.resources import load_all as load_card_resources
+from cards.render import start_render_pool, shutdown_render_pool
 
 # === Logging setup ===
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s:%(name)s: %(message)s')
@@ -29,7 +33,16 @@ BOT_STATUS_CHANNEL = 1454137711140147332
 YEARLY_STATS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "yearly_stats.json")
 
 # === Bot instance ===
-bot = discord.Bot(
+class ArchieBot(discord.Bot):
+    async def close(self):
+        # Release pooled HTTP connections before the event loop goes away
+        await get_prewarmer().stop()
+        await get_api_client().close()
+        await get_http_pool().close()
+        shutdown_render_pool()
+        await super().close()
+
+bot = ArchieBot(
     allowed_mentions=discord.AllowedMentions(everyone=False, users=False, roles=False)
 )
 
@@ -251,10 +264,17 @@ async def on_ready():
     load_card_resources()
     logger.info("Pre-loaded fonts and templates")
     
+    # Open keep-alive connections so the first command skips the TLS handshake
+    await get_http_pool().warm_up()
+    logger.info("Warmed up HTTP connections")
+    
     # Sync commands
     await bot.sync_commands()
     logger.info(f"{bot.user} commands synced!")
     
+    # Keep the fixed-choice leaderboards cached in the background
+    get_prewarmer().start()
+    
     # Start daily recap loop
     bot.loop.create_task(daily_recap_loop())
     
@@ -345,4 +365,6 @@ for cog in cogs:
 
 # === Run bot ===
 if __name__ == "__main__":
+    # Forked before bot.run() starts the event loop and its threads
+    start_render_pool()
     bot.run(os.getenv('TOKEN'))
@@ -1,4 +1,5 @@
 from .resources import load_all, get_font, get_template
+from .layout import CardData, CardLayout, CardSpec, Cell, HeadSlot, Row, Text
 from .lifestats import generate_lifestats_card, generate_lifestats_card_async
 from .duelstats import generate_duelstats_card, generate_duelstats_card_async
 from .serverstats import generate_serverstats_card, generate_serverstats_card_async
@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+# Rasterized strings kept per (text, font); labels and common values stay warm
+TEXT_CACHE_SIZE = 2048
+# Strings made only of these are assembled from per-character masks
+NUMERIC_GLYPHS = "0123456789,.#%-+M/:kKdh "
+# Checked against FreeType's own rendering before a font's glyphs are used to assemble text
+_GLYPH_PROBE = "#1,234,567.89% 12d 5h -3/4:1.5M+2kK"
+
+Mask = Tuple[Image.Image, Tuple[int, int]]
+
+_masks: "OrderedDict[Tuple[str, ImageFont.FreeTypeFont], Mask]" = OrderedDict()
+_masks_lock = threading.Lock()
+_assembles: Dict[ImageFont.FreeTypeFont, bool] = {}
+
+
+@lru_cache(maxsize=64)
+def shadow_color(color: str) -> Tuple[int, int, int]:
+    """Minecraft-style text shadow: the text colour at 30%."""
+    return tuple(max(0, int(int(color.lstrip('#')[i:i+2], 16) * 0.3)) for i in (0, 2, 4))
+
+@lru_cache(maxsize=4096)
+def text_bbox(text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int, int, int]:
+    return font.getbbox(text)
+
+def text_width(text: str, font: ImageFont.FreeTypeFont) -> int:
+    bbox = text_bbox(text, font)
+    return bbox[2] - bbox[0]
+
+def _rasterize(text: str, font: ImageFont.FreeTypeFont) -> Mask:
+    left, top, right, bottom = text_bbox(text, font)
+    mask = Image.new("L", (max(0, right - left), max(0, bottom - top)))
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+def _assemble(text: str, font: ImageFont.FreeTypeFont) -> Mask:
+    """Build a string's mask by pasting cached per-character masks along the pen position."""
+    left, top, right, bottom = text_bbox(text, font)
+    mask = Image.new("L", (max(0, right - left), max(0, bottom - top)))
+    pen = 0
+    for ch in text:
+        glyph, (gx, gy) = text_mask(ch, font)
+        if glyph.width and glyph.height:
+            mask.paste(255, (pen + gx - left, gy - top), glyph)
+        pen += int(font.getlength(ch))
+    return mask, (left, top)
+
+def _can_assemble(font: ImageFont.FreeTypeFont) -> bool:
+    """Whether assembling from glyphs reproduces this font's rendering exactly (no kerning, whole-pixel advances)."""
+    ok = _assembles.get(font)
+    if ok is None:
+        try:
+            ok = all(float(font.getlength(ch)).is_integer() for ch in NUMERIC_GLYPHS)
+            if ok:
+                expected, assembled = _rasterize(_GLYPH_PROBE, font), _assemble(_GLYPH_PROBE, font)
+                ok = expected[1] == assembled[1] and expected[0].tobytes() == assembled[0].tobytes()
+        except Exception:
+            ok = False
+        _assembles[font] = ok
+    return ok
+
+def text_mask(text: str, font: ImageFont.FreeTypeFont) -> Mask:
+    """Coverage mask of `text` in `font` plus its offset from the draw position, cached.
+
+    Colour isn't part of the key: the same mask fills both the shadow and
+    the text, in any colour.
+    """
+    key = (text, font)
+    with _masks_lock:
+        cached = _masks.get(key)
+        if cached is not None:
+            _masks.move_to_end(key)
+            return cached
+    if len(text) > 1 and all(ch in NUMERIC_GLYPHS for ch in text) and _can_assemble(font):
+        cached = _assemble(text, font)
+    else:
+        cached = _rasterize(text, font)
+    with _masks_lock:
+        _masks[key] = cached
+        if len(_masks) > TEXT_CACHE_SIZE:
+            _masks.popitem(last=False)
+    return cached
+
+def draw_text(image: Image.Image, x: int, y: int, text: str, font: ImageFont.FreeTypeFont, color: str,
+              shadow: Optional[Tuple[int, int, int]] = None, centered: bool = False):
+    """Draw text with its shadow offset 2px; `centered` makes x the horizontal centre.
+
+    Pixel-for-pixel the same as two `ImageDraw.text` calls, but fills a
+    cached mask instead of rasterizing the string each time.
+    """
+    if not text:
+        return
+    if centered:
+        x -= text_width(text, font) // 2
+    mask, (dx, dy) = text_mask(text, font)
+    if not mask.width or not mask.height:
+        return
+    image.paste(shadow or shadow_color(color), (x + dx + 2, y + dy + 2), mask)
+    image.paste(color, (x + dx, y + dy), mask)
+
+def cache_stats() -> Dict[str, int]:
+    info = text_bbox.cache_info()
+    return {"masks": len(_masks), "bbox_hits": info.hits, "bbox_misses": info.misses}
@@ -0,0 +1,244 @@
+import io
+import threading
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple, Union
+from PIL import Image, ImageDraw
+
+from utils.player_stats import PlayerStats
+from .resources import get_font, get_background, get_chrome, get_default_head
+from .drawing import draw_text, shadow_color
+
+GOLD = "#FFAA00"
+GREEN = "#55FF55"
+RED = "#FF5555"
+AQUA = "#55FFFF"
+PINK = "#FF55FF"
+WHITE = "#FFFFFF"
+GRAY = "#AAAAAA"
+BG_COLOR = (20, 20, 20, 200)
+BORDER_COLOR = (100, 100, 100, 255)
+
+
+class CardData:
+    """What a card is drawn from: a player's statistics plus any loose fields (username, playtime...).
+
+    Fields shadow statistics of the same name.
+    """
+    __slots__ = ("stats", "fields")
+
+    def __init__(self, stats: Optional[PlayerStats] = None, **fields: Any):
+        self.stats = stats if stats is not None else PlayerStats.coerce(None)
+        self.fields = fields
+
+    def value(self, stat: str, default: Any = 0) -> Any:
+        if stat in self.fields:
+            return self.fields[stat]
+        return self.stats.value(stat, default)
+
+    def position(self, stat: str) -> Optional[int]:
+        return self.stats.position(stat)
+
+
+Formatter = Callable[[CardData, str], str]
+Color = Union[str, Callable[[CardData], str]]
+
+
+def format_number(n) -> str:
+    if isinstance(n, float): return f"{n:.2f}"
+    if isinstance(n, int):
+        if n >= 1000000: return f"{n/1000000:.2f}M"
+        return f"{n:,}"
+    return str(n)
+
+def number(data: CardData, stat: str) -> str:
+    return format_number(data.value(stat))
+
+def text(data: CardData, stat: str) -> str:
+    return str(data.value(stat))
+
+def rank(data: CardData, stat: str) -> str:
+    position = data.position(stat)
+    return f"#{position:,}" if position else "N/A"
+
+def win_rate(wins: str, losses: str) -> Formatter:
+    """Formatter for wins / (wins + losses) as a percentage; the cell's own stat is ignored."""
+    def formatter(data: CardData, stat: str) -> str:
+        w, l = data.value(wins), data.value(losses)
+        return f"{(w / (w + l) * 100) if (w + l) > 0 else 0:.1f}%"
+    return formatter
+
+
+class Cell(NamedTuple):
+    label: str
+    stat: str
+    color: str
+    formatter: Formatter = number
+
+
+class Row(NamedTuple):
+    """A band of equal-width cells between two y positions, with a divider line along its bottom."""
+    top: int
+    bottom: int
+    cells: Sequence[Cell]
+    label_color: Optional[str] = None  # defaults to each cell's colour
+    label_dy: int = 15
+    value_dy: int = 40
+    label_size: int = 26
+    value_size: int = 40
+    divider_inset: Tuple[int, int] = (5, 5)
+
+
+class Text(NamedTuple):
+    """Shadowed text at (x, y); static unless `formatter` is set, in which case it reads `stat`."""
+    x: int
+    y: int
+    text: str
+    size: int
+    color: Color
+    centered: bool = False
+    stat: str = ""
+    formatter: Optional[Formatter] = None
+
+
+class HeadSlot(NamedTuple):
+    x: int
+    y: int
+    size: int = 80
+
+
+class CardSpec(NamedTuple):
+    name: str
+    size: Tuple[int, int]
+    background: str
+    overlay: int = 80
+    head: Optional[HeadSlot] = None
+    rules: Sequence[int] = ()  # y of full-width divider lines outside the rows
+    texts: Sequence[Text] = ()
+    rows: Sequence[Row] = ()
+
+
+_layouts: List["CardLayout"] = []
+
+
+class _Op(NamedTuple):
+    """One text draw with everything but the string precomputed; static when `formatter` is None."""
+    x: int
+    y: int
+    centered: bool
+    font: Any
+    color: Color
+    shadow: Optional[tuple]
+    stat: str
+    formatter: Optional[Formatter]
+    text: str = ""
+
+
+class _Divider(NamedTuple):
+    """A vertical line between two cells of a row."""
+    points: Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+class CardLayout:
+    """A card spec compiled into a cached static layer plus a flat list of draws.
+
+    The spec is compiled on first render: the panel, rules and row lines go
+    into the chrome layer, and every text and cell divider becomes a draw
+    with its position, font and colours resolved, so rendering a card is a
+    loop of formatter calls and cached text draws. Texts and dividers stay
+    out of the chrome because values may overlap them, and they have to be
+    drawn in the spec's order for those overlaps to come out right.
+    """
+
+    def __init__(self, spec: CardSpec):
+        self.spec = spec
+        self._ops: Optional[List[Union[_Op, _Divider]]] = None
+        self._lock = threading.Lock()
+        _layouts.append(self)
+
+    def prepare(self):
+        """Compile the spec and build its chrome now rather than on the first render."""
+        if self._ops is None:
+            with self._lock:
+                if self._ops is None:
+                    self._ops = self._compile()
+        get_chrome(self.spec.name, self.spec.size, self._draw_chrome)
+
+    def _compile(self) -> List[Union[_Op, _Divider]]:
+        spec = self.spec
+        width = spec.size[0]
+        ops = []
+
+        def op(x, y, size, color, centered, stat="", formatter=None, text=""):
+            ops.append(_Op(x, y, centered, get_font(size), color,
+                           None if callable(color) else shadow_color(color), stat, formatter, text))
+
+        for t in spec.texts:
+            op(t.x, t.y, t.size, t.color, t.centered, t.stat, t.formatter, t.text)
+        for row in spec.rows:
+            col = (width - 40) // len(row.cells)
+            for i, cell in enumerate(row.cells):
+                x = 20 + col*i + col//2
+                op(x, row.top + row.label_dy, row.label_size, row.label_color or cell.color, True, text=cell.label)
+                op(x, row.top + row.value_dy, row.value_size, cell.color, True, cell.stat, cell.formatter)
+            for i in range(1, len(row.cells)):
+                ops.append(_Divider(((20 + col*i, row.top + row.divider_inset[0]),
+                                     (20 + col*i, row.bottom - row.divider_inset[1]))))
+        return ops
+
+    def _draw_chrome(self, chrome: Image.Image):
+        spec = self.spec
+        draw = ImageDraw.Draw(chrome)
+        width, height = spec.size
+        draw.rounded_rectangle([0, 0, width-1, height-1], radius=12, fill=BG_COLOR, outline=BORDER_COLOR, width=2)
+        for y in spec.rules:
+            draw.line([(20, y), (width - 20, y)], fill=BORDER_COLOR, width=1)
+        for row in spec.rows:
+            draw.line([(20, row.bottom), (width - 20, row.bottom)], fill=BORDER_COLOR, width=1)
+
+    def render(self, data: CardData, head_data: Optional[bytes] = None) -> io.BytesIO:
+        """Draw the card for `data` and return it as PNG."""
+        if self._ops is None:
+            self.prepare()
+        spec = self.spec
+        card = get_chrome(spec.name, spec.size, self._draw_chrome)
+        draw = ImageDraw.Draw(card)
+
+        if spec.head is not None:
+            head = spec.head
+            skin_img = _open_head(head_data).resize((head.size, head.size), Image.Resampling.LANCZOS)
+            card.paste(skin_img, (head.x, head.y), skin_img)
+            draw.rectangle([head.x - 1, head.y - 1, head.x + head.size + 1, head.y + head.size + 1], outline=BORDER_COLOR, width=2)
+
+        for o in self._ops:
+            if type(o) is _Divider:
+                draw.line(o.points, fill=BORDER_COLOR, width=1)
+                continue
+            color, shadow = o.color, o.shadow
+            if callable(color):
+                color = color(data)
+                shadow = shadow_color(color)
+            value = o.text if o.formatter is None else o.formatter(data, o.stat)
+            draw_text(card, o.x, o.y, value, o.font, color, shadow, o.centered)
+
+        final = Image.alpha_composite(get_background(spec.background, spec.size, overlay=spec.overlay), card)
+
+        buf = io.BytesIO()
+        final.save(buf, format="PNG", optimize=False)
+        buf.seek(0)
+        return buf
+
+
+def prepare_all():
+    """Prepare every card layout that's been defined (i.e. whose module is imported)."""
+    for layout in _layouts:
+        layout.prepare()
+
+
+def _open_head(head_data: Optional[bytes]) -> Image.Image:
+    if head_data:
+        try:
+            skin_img = Image.open(io.BytesIO(head_data)).convert("RGBA")
+            if skin_img.size[0] > 0 and skin_img.size[1] > 0:
+                return skin_img
+        except Exception:
+            pass
+    return get_default_head()
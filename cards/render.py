@@ -0,0 +1,89 @@
+import io
+import os
+import signal
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+
+logger = logging.getLogger('archie-bot')
+
+# Number of render worker processes; 0 keeps rendering on the event loop's default thread pool
+RENDER_WORKERS_ENV = "ARCHIE_RENDER_WORKERS"
+DEFAULT_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker():
+    # Ctrl+C is for the bot to handle; it shuts the pool down from there
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _render_png(generate: Callable[..., io.BytesIO], *args) -> bytes:
+    """Worker side of a render: only the encoded PNG goes back to the bot."""
+    return generate(*args).getvalue()
+
+def render_workers_from_env() -> int:
+    setting = os.getenv(RENDER_WORKERS_ENV, "").strip()
+    try:
+        return max(0, int(setting)) if setting else DEFAULT_RENDER_WORKERS
+    except ValueError:
+        logger.warning(f"Ignoring {RENDER_WORKERS_ENV}={setting!r}, expected a number of workers")
+        return DEFAULT_RENDER_WORKERS
+
+def start_render_pool(workers: Optional[int] = None):
+    """Fork the card render workers, with fonts, backgrounds and card layouts already loaded.
+
+    Must run before the event loop and any threads start: the workers are
+    forked, so they inherit the loaded assets instead of each loading (or
+    re-importing the bot to get) their own. Without it, or on platforms that
+    can't fork, cards render in threads.
+    """
+    global _pool
+    workers = render_workers_from_env() if workers is None else workers
+    if _pool is not None or workers <= 0:
+        return
+    if "fork" not in multiprocessing.get_all_start_methods():
+        # e.g. Windows: spawned workers would each re-import and re-run bot.py
+        logger.info("Platform can't fork render workers, rendering cards in threads")
+        return
+    from .resources import load_all
+    from .layout import prepare_all
+    load_all()
+    prepare_all()
+    _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"), initializer=_init_worker)
+    # The first submit forks every worker
+    _pool.submit(int)
+    logger.info(f"Started {workers} card render workers")
+
+def shutdown_render_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def render_card(generate: Callable[..., io.BytesIO], *args) -> io.BytesIO:
+    """Run a card generator on a render worker, or in the default executor if there are none.
+
+    Not bound by the interaction deadline: by the time a card is drawn its
+    data is in hand, and the fetch stages leave RENDER_RESERVE for drawing,
+    so the card is always finished rather than thrown away.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        if _pool is not None:
+            result = await loop.run_in_executor(_pool, _render_png, generate, *args)
+        else:
+            result = await loop.run_in_executor(None, generate, *args)
+    except BrokenProcessPool:
+        # A worker died (OOM, killed); the pool can't be refilled without forking a
+        # process that has threads, so render in threads from now on
+        logger.error("Card render workers died, rendering in threads from now on")
+        shutdown_render_pool()
+        return await render_card(generate, *args)
+    # BytesIO shares the received bytes rather than copying them
+    return io.BytesIO(result) if isinstance(result, bytes) else result
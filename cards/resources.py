@@ -1,7 +1,11 @@
+import io
 import os
 import logging
-from typing import Dict, Optional
-from PIL import Image, ImageFont
+import threading
+from typing import Callable, Dict, Optional, Tuple
+from PIL import Image, ImageFilter, ImageFont
+
+from utils.api_client import get_default_head as get_default_head_png
 
 logger = logging.getLogger('archie-bot')
 
@@ -11,6 +15,12 @@ FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fonts", "M
 
 _cached_fonts: Dict[int, ImageFont.FreeTypeFont] = {}
 _cached_templates: Dict[str, Image.Image] = {}
+# Finished card backgrounds, keyed by (template, size, blur radius, overlay alpha)
+_cached_backgrounds: Dict[Tuple[str, Tuple[int, int], float, int], Image.Image] = {}
+_build_lock = threading.Lock()
+# Static parts of each card type (panel, dividers, labels), keyed by card name
+_cached_chrome: Dict[str, Image.Image] = {}
+_default_head: Optional[Image.Image] = None
 
 def _load_fonts():
     """Pre-load fonts at startup."""
@@ -56,7 +66,64 @@ def get_template(name: str) -> Optional[Image.Image]:
     tpl = _cached_templates.get(name)
     return tpl.copy() if tpl else None
 
+def get_background(name: str, size: Tuple[int, int], blur: float = 3, overlay: int = 80) -> Image.Image:
+    """Template `name` scaled to `size`, blurred and darkened, built once per key.
+
+    Shared between renders, so don't draw on it; `Image.alpha_composite`
+    returns a new image, which is all the cards need. A missing template
+    gives a plain dark background.
+    """
+    key = (name, size, blur, overlay)
+    bg = _cached_backgrounds.get(key)
+    if bg is not None:
+        return bg
+    with _build_lock:
+        bg = _cached_backgrounds.get(key)
+        if bg is None:
+            if not _cached_templates:
+                _load_templates()
+            tpl = _cached_templates.get(name)
+            if tpl is None:
+                bg = Image.new("RGBA", size, (30, 30, 30, 255))
+            else:
+                bg = tpl.resize(size, Image.Resampling.LANCZOS)
+            bg = bg.filter(ImageFilter.GaussianBlur(radius=blur))
+            bg = Image.alpha_composite(bg, Image.new("RGBA", size, (0, 0, 0, overlay)))
+            _cached_backgrounds[key] = bg
+    return bg
+
+def get_chrome(name: str, size: Tuple[int, int], build: Callable[[Image.Image], None]) -> Image.Image:
+    """A copy of card `name`'s static layer, drawn by `build` on first use.
+
+    `build` draws the parts that are the same on every card of that type
+    and sit under everything else (panel, lines) onto a transparent `size` canvas;
+    renderers draw the rest onto the copy.
+    """
+    chrome = _cached_chrome.get(name)
+    if chrome is None:
+        with _build_lock:
+            chrome = _cached_chrome.get(name)
+            if chrome is None:
+                chrome = Image.new("RGBA", size, (0, 0, 0, 0))
+                build(chrome)
+                _cached_chrome[name] = chrome
+    return chrome.copy()
+
+def get_default_head() -> Image.Image:
+    """The bundled Steve head, for players whose head couldn't be fetched."""
+    global _default_head
+    if _default_head is None:
+        try:
+            _default_head = Image.open(io.BytesIO(get_default_head_png())).convert("RGBA")
+        except Exception as e:
+            logger.warning(f"Failed to load the default head: {e}")
+            _default_head = Image.new("RGBA", (80, 80), (139, 90, 43, 255))
+    return _default_head.copy()
+
 def load_all():
     """Pre-load all resources."""
     _load_fonts()
     _load_templates()
+    for name in ('lifesteal', 'duels', 'skywars.png'):
+        get_background(name, (800, 520))
+    get_background('lifesteal', (600, 380), overlay=100)
@@ -4,14 +4,36 @@ import logging
 
 from utils.security import check_cooldown, sanitize_username, is_username_blocked, contains_mention
 from utils.api_client import get_api_client
+from utils.rate_limit import Priority
 from utils.error_logging import log_error_to_channel
+from utils.deadline import Deadline
+from utils.prewarm import get_prewarmer
+from utils.leaderboard_view import LeaderboardPages, LEADERBOARD_FETCH_SIZE, leaderboard_entries, respond_with_leaderboard
+from utils.merged_leaderboard import RANKED_ELO_STAT_IDS, get_merged_leaderboard
+from utils.player_stats import parse_stat_id
 
 logger = logging.getLogger('archie-bot')
 
+DUELTOP_STATS = [
+    "elo:nodebuff:ranked:lifetime",
+    "elo:sumo:ranked:lifetime",
+    "elo:bridges:ranked:lifetime",
+    "wins:nodebuff:ranked:lifetime",
+    "wins:sumo:ranked:lifetime",
+    "wins:bridges:ranked:lifetime"
+]
+# Pseudo stat ID for the best ranked ELO of each player across every kit
+MERGED_ELO_STATID = "elo:*:ranked:lifetime"
+
+
+def dueltop_path(statid: str, page: int = 0) -> str:
+    return f"/v1/leaderboards/{statid}?page={page}&size={LEADERBOARD_FETCH_SIZE}"
+
 
 class DuelsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        get_prewarmer().register(*(dueltop_path(statid) for statid in DUELTOP_STATS))
 
     @discord.slash_command(
         name="dueltop",
@@ -20,20 +42,14 @@ class DuelsCog(commands.Cog):
             discord.Option(
                 str,
                 "Select the duel stat",
-                choices=[
-                    "elo:nodebuff:ranked:lifetime",
-                    "elo:sumo:ranked:lifetime",
-                    "elo:bridge:ranked:lifetime",
-                    "wins:nodebuff:ranked:lifetime",
-                    "wins:sumo:ranked:lifetime",
-                    "wins:bridge:ranked:lifetime"
-                ],
+                choices=DUELTOP_STATS + [discord.OptionChoice("best ranked ELO (all kits)", MERGED_ELO_STATID)],
                 required=True,
                 name="statid"
             )
         ]
     )
     async def dueltop(self, ctx: discord.ApplicationContext, statid: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -41,24 +57,30 @@ class DuelsCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            data = await client.get(f"/v1/leaderboards/{statid}?page=0&size=10")
-            if data and isinstance(data, dict):
-                entries = data.get("entries") or data.get("leaderboard") or []
-                if isinstance(entries, list) and entries:
+            if statid == MERGED_ELO_STATID:
+                await self._merged_elo_top(ctx, client, deadline)
+                return
+            get_prewarmer().record_use(dueltop_path(statid))
+            entries = leaderboard_entries(await client.get(dueltop_path(statid), deadline=deadline), "entries", "leaderboard")
+            if entries:
+                async def fetch_chunk(page):
+                    data = await client.get(dueltop_path(statid, page), Priority.PREFETCH)
+                    return leaderboard_entries(data, "entries", "leaderboard")
+
+                def render(page_entries, start):
                     leaderboard_lines = [
-                        f"**#{entry.get('position', i+1)}** {entry.get('username', 'Unknown')} — `{entry.get('value', 0)}`"
-                        for i, entry in enumerate(entries)
+                        f"**#{entry.get('position', start+i+1)}** {entry.get('username', 'Unknown')} — `{entry.get('value', 0)}`"
+                        for i, entry in enumerate(page_entries)
                     ]
-                    leaderboard_text = "\n".join(leaderboard_lines)
                     embed = discord.Embed(
                         title=f"🥊 Duel Top: {statid}",
-                        description=leaderboard_text,
+                        description="\n".join(leaderboard_lines),
                         color=discord.Color.blue()
                     )
                     embed.set_footer(text="ArchMC Duels • Official API")
-                    await ctx.respond(embed=embed)
-                else:
-                    await ctx.respond("No duel leaderboard data found.")
+                    return embed
+
+                await respond_with_leaderboard(ctx, LeaderboardPages(entries, fetch_chunk), render)
             else:
                 await ctx.respond("No duel leaderboard data found.")
         except Exception as e:
@@ -66,6 +88,34 @@ class DuelsCog(commands.Cog):
             await log_error_to_channel(self.bot, "dueltop", ctx.author, ctx.guild, e, {"statid": statid})
             await ctx.respond("Failed to fetch duel leaderboard. Please try again later.")
 
+    async def _merged_elo_top(self, ctx, client, deadline):
+        board = get_merged_leaderboard(client, "ranked-elo", RANKED_ELO_STAT_IDS, dueltop_path)
+        entries = await board.top(LEADERBOARD_FETCH_SIZE, deadline=deadline)
+        if not entries:
+            await ctx.respond("No duel leaderboard data found.")
+            return
+
+        async def fetch_chunk(page):
+            return await board.top(LEADERBOARD_FETCH_SIZE, page * LEADERBOARD_FETCH_SIZE, Priority.PREFETCH)
+
+        def render(page_entries, start):
+            leaderboard_lines = [
+                f"**#{entry['position']}** {entry['username']} — `{entry['value']}` ({entry['kit']})"
+                for entry in page_entries
+            ]
+            embed = discord.Embed(
+                title="🥊 Duel Top: best ranked ELO (all kits)",
+                description="\n".join(leaderboard_lines),
+                color=discord.Color.blue()
+            )
+            if board.partial:
+                kits = ", ".join(parse_stat_id(stat_id).mode for stat_id in board.failed_sources)
+                embed.set_footer(text=f"Partial results: couldn't load {kits} • ArchMC Duels")
+            else:
+                embed.set_footer(text="ArchMC Duels • Official API")
+            return embed
+
+        await respond_with_leaderboard(ctx, LeaderboardPages(entries, fetch_chunk), render)
 
 
 def setup(bot):
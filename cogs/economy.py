@@ -3,15 +3,43 @@ from discord.ext import commands
 import logging
 
 from utils.security import check_cooldown, sanitize_username, is_username_blocked, contains_mention
-from utils.api_client import get_api_client
+from utils.api_client import get_api_client, ApiError, NotFoundError
+from utils.rate_limit import Priority
 from utils.error_logging import log_error_to_channel
+from utils.deadline import Deadline
+from utils.prewarm import get_prewarmer
+from utils.leaderboard_view import LeaderboardPages, LEADERBOARD_FETCH_SIZE, leaderboard_entries, respond_with_leaderboard
 
 logger = logging.getLogger('archie-bot')
 
+BALTOP_TYPES = [
+    "lifesteal-coins",
+    "bedwars-coins",
+    "kitpvp-coins",
+    "gems",
+    "bedwars-experience",
+    "skywars-coins",
+    "skywars-experience"
+]
+PLAYTIME_GAMEMODES = {"lifesteal": "trojan", "survival": "spartan"}
+PLAYTIME_LIST_KEYS = ("entries", "players", "leaderboard")
+
+
+def baltop_path(type: str) -> str:
+    return f"/v1/economy/baltop/{type}"
+
+
+def playtime_path(mode: str, page: int = 0) -> str:
+    return f"/v1/ugc/{PLAYTIME_GAMEMODES[mode]}/leaderboard/playtime?page={page}&size={LEADERBOARD_FETCH_SIZE}"
+
 
 class EconomyCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        get_prewarmer().register(
+            *(baltop_path(type) for type in BALTOP_TYPES),
+            *(playtime_path(mode) for mode in PLAYTIME_GAMEMODES),
+        )
 
     @discord.slash_command(
         name="balance",
@@ -33,6 +61,7 @@ class EconomyCog(commands.Cog):
         ]
     )
     async def balance(self, ctx: discord.ApplicationContext, gamemode: str, username: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -64,7 +93,10 @@ class EconomyCog(commands.Cog):
                 return
             
             client = get_api_client()
-            data = await client.get(f"/v1/economy/player/username/{safe_username}")
+            try:
+                data = await client.fetch(f"/v1/economy/player/username/{safe_username}", deadline=deadline)
+            except NotFoundError:
+                data = None
             
             if data and isinstance(data, dict):
                 balances = data.get("balances", {})
@@ -91,6 +123,8 @@ class EconomyCog(commands.Cog):
                     await ctx.respond(embed=embed)
             else:
                 await ctx.respond(f"No balance profile found for **{safe_username}**.")
+        except ApiError:
+            await ctx.respond("Couldn't reach ArchMC right now, please try again in a moment.")
         except Exception as e:
             logger.error(f"balance error: {e}")
             await log_error_to_channel(self.bot, "balance", ctx.author, ctx.guild, e, {"username": safe_username, "gamemode": gamemode})
@@ -103,21 +137,14 @@ class EconomyCog(commands.Cog):
             discord.Option(
                 str,
                 "Select the baltop type",
-                choices=[
-                    "lifesteal-coins",
-                    "bedwars-coins",
-                    "kitpvp-coins",
-                    "gems",
-                    "bedwars-experience",
-                    "skywars-coins",
-                    "skywars-experience"
-                ],
+                choices=BALTOP_TYPES,
                 required=True,
                 name="type"
             )
         ]
     )
     async def baltop(self, ctx: discord.ApplicationContext, type: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -125,24 +152,24 @@ class EconomyCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            data = await client.get(f"/v1/economy/baltop/{type}")
-            if data and isinstance(data, dict):
-                entries = data.get("entries") or []
-                if isinstance(entries, list) and entries:
+            get_prewarmer().record_use(baltop_path(type))
+            entries = leaderboard_entries(await client.get(baltop_path(type), deadline=deadline))
+            if entries:
+                def render(page_entries, start):
                     leaderboard_lines = [
-                        f"**#{entry.get('position', i+1)}** {entry.get('username', 'Unknown')} — `{entry.get('balance', 0)}`"
-                        for i, entry in enumerate(entries)
+                        f"**#{entry.get('position', start+i+1)}** {entry.get('username', 'Unknown')} — `{entry.get('balance', 0)}`"
+                        for i, entry in enumerate(page_entries)
                     ]
-                    leaderboard_text = "\n".join(leaderboard_lines)
                     embed = discord.Embed(
                         title=f"🏦 Baltop Leaderboard: {type.replace('-', ' ').title()}",
-                        description=leaderboard_text,
+                        description="\n".join(leaderboard_lines),
                         color=discord.Color.gold()
                     )
                     embed.set_footer(text="ArchMC Baltop • Official API")
-                    await ctx.respond(embed=embed)
-                else:
-                    await ctx.respond("No baltop data found for that type.")
+                    return embed
+
+                # The baltop endpoint isn't paged: the whole list comes back at once
+                await respond_with_leaderboard(ctx, LeaderboardPages(entries), render)
             else:
                 await ctx.respond("No baltop data found for that type.")
         except Exception as e:
@@ -157,13 +184,14 @@ class EconomyCog(commands.Cog):
             discord.Option(
                 str,
                 "Select the server mode",
-                choices=["lifesteal", "survival"],
+                choices=list(PLAYTIME_GAMEMODES),
                 required=True,
                 name="mode"
             )
         ]
     )
     async def playtime(self, ctx: discord.ApplicationContext, mode: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -171,25 +199,30 @@ class EconomyCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            gamemode = "trojan" if mode == "lifesteal" else "spartan"
-            leaderboard = await client.get(f"/v1/ugc/{gamemode}/leaderboard/playtime?page=0&size=10")
-            entries = leaderboard.get("entries") or leaderboard.get("players") or leaderboard.get("leaderboard") or []
-            if isinstance(entries, list) and entries:
-                leaderboard_lines = []
-                for i, entry in enumerate(entries):
-                    username = entry.get("username") or entry.get("name") or "Unknown"
-                    playtime_ms = entry.get("playtimeSeconds") or 0
-                    playtime_hours = int(playtime_ms // 1000 // 3600)
-                    leaderboard_lines.append(f"**#{entry.get('position', i+1)}** {username} — `{playtime_hours} hours`")
-                leaderboard_text = "\n".join(leaderboard_lines)
-                color = discord.Color.red() if mode == "lifesteal" else discord.Color.green()
-                embed = discord.Embed(
-                    title=f"⏱️ {mode.capitalize()} Playtime Top",
-                    description=leaderboard_text,
-                    color=color
-                )
-                embed.set_footer(text=f"ArchMC {mode.capitalize()} • Official API")
-                await ctx.respond(embed=embed)
+            get_prewarmer().record_use(playtime_path(mode))
+            entries = leaderboard_entries(await client.get(playtime_path(mode), deadline=deadline), *PLAYTIME_LIST_KEYS)
+            if entries:
+                async def fetch_chunk(page):
+                    data = await client.get(playtime_path(mode, page), Priority.PREFETCH)
+                    return leaderboard_entries(data, *PLAYTIME_LIST_KEYS)
+
+                def render(page_entries, start):
+                    leaderboard_lines = []
+                    for i, entry in enumerate(page_entries):
+                        username = entry.get("username") or entry.get("name") or "Unknown"
+                        playtime_ms = entry.get("playtimeSeconds") or 0
+                        playtime_hours = int(playtime_ms // 1000 // 3600)
+                        leaderboard_lines.append(f"**#{entry.get('position', start+i+1)}** {username} — `{playtime_hours} hours`")
+                    color = discord.Color.red() if mode == "lifesteal" else discord.Color.green()
+                    embed = discord.Embed(
+                        title=f"⏱️ {mode.capitalize()} Playtime Top",
+                        description="\n".join(leaderboard_lines),
+                        color=color
+                    )
+                    embed.set_footer(text=f"ArchMC {mode.capitalize()} • Official API")
+                    return embed
+
+                await respond_with_leaderboard(ctx, LeaderboardPages(entries, fetch_chunk), render)
             else:
                 await ctx.respond("No leaderboard data found.")
         except Exception as e:
@@ -3,7 +3,8 @@ from discord.ext import commands
 import logging
 
 from utils.security import check_cooldown, sanitize_username, is_username_blocked, validate_input, contains_mention
-from utils.api_client import get_api_client
+from utils.api_client import get_api_client, ApiError, NotFoundError
+from utils.deadline import Deadline
 
 logger = logging.getLogger('archie-bot')
 
@@ -25,6 +26,7 @@ class GuildsCog(commands.Cog):
         ]
     )
     async def guild(self, ctx: discord.ApplicationContext, username: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -44,7 +46,10 @@ class GuildsCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            data = await client.get(f"/v1/guilds/player/username/{safe_username}")
+            try:
+                data = await client.fetch(f"/v1/guilds/player/username/{safe_username}", deadline=deadline)
+            except NotFoundError:
+                data = None
             if data and isinstance(data, dict):
                 guild_name = data.get("displayName") or data.get("name") or "Unknown"
                 level = data.get("level", 0)
@@ -66,6 +71,8 @@ class GuildsCog(commands.Cog):
                 await ctx.respond(embed=embed)
             else:
                 await ctx.respond(f"**{safe_username}** is not in a guild.")
+        except ApiError:
+            await ctx.respond("Couldn't reach ArchMC right now, please try again in a moment.")
         except Exception as e:
             logger.error(f"guild error: {e}")
             await ctx.respond("Failed to fetch guild info. Please try again later.")
@@ -83,6 +90,7 @@ class GuildsCog(commands.Cog):
         ]
     )
     async def guildsearch(self, ctx: discord.ApplicationContext, query: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -100,7 +108,7 @@ class GuildsCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            data = await client.get(f"/v1/guilds/search/name?q={safe_query}")
+            data = await client.get(f"/v1/guilds/search/name?q={safe_query}", deadline=deadline)
             if data and isinstance(data, dict):
                 guilds = data.get("guilds") or data.get("results") or []
                 if isinstance(guilds, list) and guilds:
@@ -4,11 +4,26 @@ import asyncio
 import logging
 
 from utils.security import check_cooldown, sanitize_username, is_username_blocked, contains_mention
-from utils.api_client import get_api_client
+from utils.api_client import get_api_client, ApiError, NotFoundError
+from utils.rate_limit import Priority
 from utils.error_logging import log_error_to_channel
+from utils.deadline import Deadline
+from utils.prewarm import get_prewarmer
+from utils.leaderboard_view import LeaderboardPages, LEADERBOARD_FETCH_SIZE, leaderboard_entries, respond_with_leaderboard
 
 logger = logging.getLogger('archie-bot')
 
+LIFESTEAL_STATS = ["kills", "deaths", "killstreak", "killDeathRatio", "blocksMined", "blocksWalked", "blocksPlaced"]
+CLAN_LIST_KEYS = ("clans", "entries", "leaderboard")
+
+
+def lifetop_path(stat: str, page: int = 0) -> str:
+    return f"/v1/ugc/trojan/leaderboard/{stat}?page={page}&size={LEADERBOARD_FETCH_SIZE}"
+
+
+def clantop_path(page: int = 0) -> str:
+    return f"/v1/ugc/trojan/clans?page={page}&size={LEADERBOARD_FETCH_SIZE}"
+
 
 def stat_to_embed(stat: dict, stat_name: str, username: str) -> discord.Embed:
     stat_emojis = {
@@ -43,6 +58,7 @@ def stat_to_embed(stat: dict, stat_name: str, username: str) -> discord.Embed:
 class LifestealCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        get_prewarmer().register(*(lifetop_path(stat) for stat in LIFESTEAL_STATS), clantop_path())
 
     @discord.slash_command(
         name="lifetop",
@@ -51,13 +67,14 @@ class LifestealCog(commands.Cog):
             discord.Option(
                 str,
                 "Select the statistic",
-                choices=["kills", "deaths", "killstreak", "killDeathRatio", "blocksMined", "blocksWalked", "blocksPlaced"],
+                choices=LIFESTEAL_STATS,
                 required=True,
                 name="stat"
             )
         ]
     )
     async def lifetop(self, ctx: discord.ApplicationContext, stat: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -65,20 +82,26 @@ class LifestealCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            leaderboard = await client.get_ugc_leaderboard("trojan", stat)
-            if leaderboard and "entries" in leaderboard:
-                leaderboard_lines = [
-                    f"**#{entry.get('position', i+1)}** {entry.get('username', 'Unknown')} — `{entry.get('value', 0)}`"
-                    for i, entry in enumerate(leaderboard["entries"])
-                ]
-                leaderboard_text = "\n".join(leaderboard_lines)
-                embed = discord.Embed(
-                    title=f"🏆 Lifesteal Top {stat.capitalize()}",
-                    description=leaderboard_text,
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text="ArchMC Lifesteal • Official API")
-                await ctx.respond(embed=embed)
+            get_prewarmer().record_use(lifetop_path(stat))
+            entries = leaderboard_entries(await client.get(lifetop_path(stat), deadline=deadline))
+            if entries:
+                async def fetch_chunk(page):
+                    return leaderboard_entries(await client.get(lifetop_path(stat, page), Priority.PREFETCH))
+
+                def render(page_entries, start):
+                    leaderboard_lines = [
+                        f"**#{entry.get('position', start+i+1)}** {entry.get('username', 'Unknown')} — `{entry.get('value', 0)}`"
+                        for i, entry in enumerate(page_entries)
+                    ]
+                    embed = discord.Embed(
+                        title=f"🏆 Lifesteal Top {stat.capitalize()}",
+                        description="\n".join(leaderboard_lines),
+                        color=discord.Color.red()
+                    )
+                    embed.set_footer(text="ArchMC Lifesteal • Official API")
+                    return embed
+
+                await respond_with_leaderboard(ctx, LeaderboardPages(entries, fetch_chunk), render)
             else:
                 await ctx.respond("No leaderboard data found.")
         except Exception as e:
@@ -99,13 +122,14 @@ class LifestealCog(commands.Cog):
             discord.Option(
                 str,
                 "Select the statistic",
-                choices=["kills", "deaths", "killstreak", "killDeathRatio", "blocksMined", "blocksWalked", "blocksPlaced"],
+                choices=LIFESTEAL_STATS,
                 required=True,
                 name="stat"
             )
         ]
     )
     async def lifestat(self, ctx: discord.ApplicationContext, username: str, stat: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -125,20 +149,31 @@ class LifestealCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            stat_info = await client.get(f"/v1/ugc/trojan/players/username/{safe_username}/statistics/{stat}")
-            if stat_info and isinstance(stat_info, dict) and "value" in stat_info:
-                embed = stat_to_embed(stat_info, stat, safe_username)
+            # One request for the full payload answers every later /lifestat (and
+            # /stat lifesteal) for this player while it's cached
+            try:
+                stats = await client.fetch(f"/v1/ugc/trojan/players/username/{safe_username}/statistics", deadline=deadline)
+            except NotFoundError:
+                stats = None
+            statistics = stats.get("statistics") if isinstance(stats, dict) else None
+            stat_val = statistics.get(stat) if isinstance(statistics, dict) else None
+            if stat_val is None and statistics is not None:
+                # The payload left this stat out; ask for it on its own
+                try:
+                    stat_info = await client.fetch(f"/v1/ugc/trojan/players/username/{safe_username}/statistics/{stat}", deadline=deadline)
+                except NotFoundError:
+                    stat_info = None
+                if isinstance(stat_info, dict) and "value" in stat_info:
+                    stat_val = stat_info
+            if stat_val is not None:
+                if not isinstance(stat_val, dict):
+                    stat_val = {"value": stat_val}
+                embed = stat_to_embed(stat_val, stat, safe_username)
                 await ctx.respond(embed=embed)
             else:
-                stats = await client.get_ugc_player_stats_by_username("trojan", safe_username)
-                stat_val = stats["statistics"].get(stat) if stats and "statistics" in stats and stat in stats["statistics"] else None
-                if stat_val is not None:
-                    if not isinstance(stat_val, dict):
-                        stat_val = {"value": stat_val}
-                    embed = stat_to_embed(stat_val, stat, safe_username)
-                    await ctx.respond(embed=embed)
-                else:
-                    await ctx.respond("No data found for that player/stat.")
+                await ctx.respond("No data found for that player/stat.")
+        except ApiError:
+            await ctx.respond("Couldn't reach ArchMC right now, please try again in a moment.")
         except Exception as e:
             logger.error(f"lifestat error: {e}")
             await log_error_to_channel(self.bot, "lifestat", ctx.author, ctx.guild, e, {"username": safe_username, "stat": stat})
@@ -146,6 +181,7 @@ class LifestealCog(commands.Cog):
 
     @discord.slash_command(name="clantop", description="Show the top clans from ArchMC")
     async def clantop(self, ctx: discord.ApplicationContext):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -153,29 +189,31 @@ class LifestealCog(commands.Cog):
         await ctx.defer()
         try:
             client = get_api_client()
-            data = await client.get("/v1/ugc/trojan/clans?page=0&size=10")
-            if data and isinstance(data, dict):
-                clans = data.get("clans") or data.get("entries") or data.get("leaderboard") or []
-                if isinstance(clans, list) and clans:
+            get_prewarmer().record_use(clantop_path())
+            clans = leaderboard_entries(await client.get(clantop_path(), deadline=deadline), *CLAN_LIST_KEYS)
+            if clans:
+                async def fetch_chunk(page):
+                    return leaderboard_entries(await client.get(clantop_path(page), Priority.PREFETCH), *CLAN_LIST_KEYS)
+
+                def render(page_clans, start):
                     leaderboard_lines = []
-                    for i, clan in enumerate(clans):
+                    for i, clan in enumerate(page_clans):
                         name = clan.get("displayName") or clan.get("name") or clan.get("clanName") or "Unknown"
                         level = clan.get("level", 0)
                         if isinstance(level, float):
                             level = int(level)
                         leader = clan.get("leaderUsername", "Unknown")
                         members = clan.get("memberCount", 0)
-                        leaderboard_lines.append(f"**#{i+1} {name}** — Level {level} | Leader: {leader} | Members: {members}")
-                    leaderboard_text = "\n".join(leaderboard_lines)
+                        leaderboard_lines.append(f"**#{start+i+1} {name}** — Level {level} | Leader: {leader} | Members: {members}")
                     embed = discord.Embed(
                         title="🏅 Top Clans",
-                        description=leaderboard_text,
+                        description="\n".join(leaderboard_lines),
                         color=discord.Color.gold()
                     )
                     embed.set_footer(text="ArchMC Clans • Official API")
-                    await ctx.respond(embed=embed)
-                else:
-                    await ctx.respond("No clan leaderboard data found.")
+                    return embed
+
+                await respond_with_leaderboard(ctx, LeaderboardPages(clans, fetch_chunk), render)
             else:
                 await ctx.respond("No clan leaderboard data found.")
         except Exception as e:
@@ -15,6 +15,7 @@ import matplotlib.pyplot as plt
 from utils.security import check_cooldown
 from utils.error_logging import log_error_to_channel
 from utils.json_ops import safe_json_load, safe_json_save
+from utils.api_client import get_http_session
 
 logger = logging.getLogger('archie-bot')
 
@@ -87,13 +88,13 @@ class StatsCog(commands.Cog):
 
     async def fetch_server_data(self):
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.get(f"https://api.mcsrvstat.us/3/{ARCHMC_IP}") as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        motd_lines = data.get("motd", {}).get("clean", [])
-                        data["_motd"] = motd_lines[1] if len(motd_lines) > 1 else (motd_lines[0] if motd_lines else "")
-                        return data
+            session = await get_http_session()
+            async with session.get(f"https://api.mcsrvstat.us/3/{ARCHMC_IP}", timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    motd_lines = data.get("motd", {}).get("clean", [])
+                    data["_motd"] = motd_lines[1] if len(motd_lines) > 1 else (motd_lines[0] if motd_lines else "")
+                    return data
         except Exception as e:
             logger.error(f"Failed to fetch server data: {e}")
         return None
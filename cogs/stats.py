@@ -4,16 +4,24 @@ import asyncio
 import logging
 
 from utils.security import check_cooldown, sanitize_username, is_username_blocked, contains_mention
-from utils.api_client import get_api_client, fetch_player_head
+from utils.api_client import get_api_client, fetch_player_head, ApiError, NotFoundError
 from utils.error_logging import log_error_to_channel
+from utils.player_stats import PlayerStats
+from utils.deadline import Deadline, RENDER_RESERVE
 from cards import (
-    generate_lifestats_card,
-    generate_duelstats_card,
-    generate_skywarsstats_card,
+    generate_lifestats_card_async,
+    generate_duelstats_card_async,
+    generate_skywarsstats_card_async,
 )
 
 logger = logging.getLogger('archie-bot')
 
+NOT_FOUND_MESSAGES = {
+    "lifesteal": "No stats found for that player.",
+    "duels": "No duel stats found for that player.",
+    "skywars": "No SkyWars stats found for that player.",
+}
+
 
 class StatCog(commands.Cog):
     def __init__(self, bot):
@@ -39,6 +47,7 @@ class StatCog(commands.Cog):
         ]
     )
     async def stat(self, ctx: discord.ApplicationContext, mode: str, username: str):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
@@ -59,94 +68,96 @@ class StatCog(commands.Cog):
 
         try:
             if mode == "lifesteal":
-                await self._lifesteal_card(ctx, safe_username)
+                await self._lifesteal_card(ctx, safe_username, deadline)
             elif mode == "duels":
-                await self._duels_card(ctx, safe_username)
+                await self._duels_card(ctx, safe_username, deadline)
             elif mode == "skywars":
-                await self._skywars_card(ctx, safe_username)
+                await self._skywars_card(ctx, safe_username, deadline)
+        except NotFoundError:
+            await ctx.respond(NOT_FOUND_MESSAGES[mode])
+        except ApiError:
+            # Rate limited, timed out or down, with nothing cached to fall back on
+            await ctx.respond("Couldn't reach ArchMC right now, please try again in a moment.")
         except Exception as e:
             logger.error(f"stat error ({mode}): {e}")
             await log_error_to_channel(self.bot, "stat", ctx.author, ctx.guild, e, {"mode": mode, "username": safe_username})
             await ctx.respond("Failed to fetch stats. Please try again later.")
 
-    async def _lifesteal_card(self, ctx, username):
+    async def _fetch_with_head(self, username, deadline, *calls):
+        """Run API calls plus the player head fetch, in parallel when the UUID is already known.
+
+        Returns (results, uuid, head_data). The first call must return the
+        payload (or PlayerStats) carrying the player's UUID, and its error is
+        raised; the other calls are optional and come back as None on failure.
+        A head that doesn't arrive in time is the bundled Steve head, and
+        head_data is None only when there's no UUID.
+        """
+        client = get_api_client()
+        known_uuid = client.lookup_uuid(username)
+        calls = list(calls)
+        if known_uuid:
+            calls.append(fetch_player_head(known_uuid, deadline))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        if isinstance(results[0], Exception):
+            raise results[0]
+        results = [None if isinstance(r, Exception) else r for r in results]
+        head_data = results.pop() if known_uuid else None
+
+        data = results[0]
+        if isinstance(data, PlayerStats):
+            uuid = data.uuid
+        else:
+            uuid = data.get("uuid", "") if isinstance(data, dict) else ""
+        if uuid and uuid != known_uuid:
+            head_data = await fetch_player_head(uuid, deadline)
+        return results, uuid, head_data
+
+    async def _lifesteal_card(self, ctx, username, deadline):
         client = get_api_client()
-        stats, profile = await asyncio.gather(
-            client.get(f"/v1/ugc/trojan/players/username/{username}/statistics"),
-            client.get(f"/v1/ugc/trojan/players/username/{username}/profile"),
-            return_exceptions=True
+        fetch_deadline = deadline.reserving(RENDER_RESERVE)
+        (stats, profile), uuid, head_data = await self._fetch_with_head(
+            username,
+            fetch_deadline,
+            client.fetch(f"/v1/ugc/trojan/players/username/{username}/statistics", deadline=fetch_deadline),
+            client.get(f"/v1/ugc/trojan/players/username/{username}/profile", deadline=fetch_deadline),
         )
 
-        if isinstance(stats, Exception):
-            stats = None
-        if isinstance(profile, Exception):
-            profile = None
-
         if not stats or not isinstance(stats, dict):
-            await ctx.respond("No stats found for that player.")
+            await ctx.respond(NOT_FOUND_MESSAGES["lifesteal"])
             return
 
         username_disp = stats.get("username", username)
-        uuid = stats.get("uuid", "")
-        statistics = stats.get("statistics", {})
-
-        head_data = await fetch_player_head(uuid)
+        statistics = PlayerStats.from_payload(stats)
 
-        loop = asyncio.get_event_loop()
-        card = await loop.run_in_executor(
-            None,
-            generate_lifestats_card,
+        card = await generate_lifestats_card_async(
             username_disp, uuid, statistics, profile or {}, head_data
         )
         file = discord.File(card, filename="lifestats.png")
         await ctx.respond(file=file)
 
-    async def _duels_card(self, ctx, username):
-        client = get_api_client()
-        data = await client.get(f"/v1/players/username/{username}/statistics")
-
-        if not data or not isinstance(data, dict):
-            await ctx.respond("No duel stats found for that player.")
-            return
-
-        username_disp = data.get("username", username)
-        uuid = data.get("uuid", "")
-        statistics = data.get("statistics", {})
+    async def _duels_card(self, ctx, username, deadline):
+        fetch_deadline = deadline.reserving(RENDER_RESERVE)
+        (statistics,), uuid, head_data = await self._fetch_with_head(
+            username, fetch_deadline, get_api_client().get_player_stats(username, deadline=fetch_deadline)
+        )
 
-        head_data = await fetch_player_head(uuid) if uuid else None
+        username_disp = statistics.username or username
 
-        loop = asyncio.get_event_loop()
-        card = await loop.run_in_executor(
-            None,
-            generate_duelstats_card,
-            username_disp, uuid, statistics, head_data
-        )
+        card = await generate_duelstats_card_async(username_disp, uuid, statistics, head_data)
         file = discord.File(card, filename="duelstats.png")
         await ctx.respond(file=file)
 
-    async def _skywars_card(self, ctx, username):
-        client = get_api_client()
-        data = await client.get(f"/v1/players/username/{username}/statistics")
-
-        if not data or not isinstance(data, dict):
-            await ctx.respond("No SkyWars stats found for that player.")
-            return
-
-        username_disp = data.get("username", username)
-        uuid = data.get("uuid", "")
-        statistics = data.get("statistics", {})
+    async def _skywars_card(self, ctx, username, deadline):
+        fetch_deadline = deadline.reserving(RENDER_RESERVE)
+        (statistics,), uuid, head_data = await self._fetch_with_head(
+            username, fetch_deadline, get_api_client().get_player_stats(username, deadline=fetch_deadline)
+        )
 
-        head_data = await fetch_player_head(uuid) if uuid else None
+        username_disp = statistics.username or username
 
-        loop = asyncio.get_event_loop()
-        card = await loop.run_in_executor(
-            None,
-            generate_skywarsstats_card,
-            username_disp, uuid, statistics, head_data
-        )
+        card = await generate_skywarsstats_card_async(username_disp, uuid, statistics, head_data)
         file = discord.File(card, filename="skywarsstats.png")
         await ctx.respond(file=file)
 
-
 def setup(bot):
     bot.add_cog(StatCog(bot))
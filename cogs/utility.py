@@ -1,21 +1,46 @@
 import discord
 from discord.ext import commands
-import asyncio
 import logging
 
 from utils.security import check_cooldown, sanitize_username, is_username_blocked, contains_mention
 from utils.api_client import get_api_client
+from utils.deadline import Deadline
+from utils.player_stats import PlayerStats
 
 logger = logging.getLogger('archie-bot')
 
 
+def best_ranked_elo(stats: PlayerStats):
+    """Highest ranked ELO across every kit ("global" is the API's own aggregate, not a kit)."""
+    return max((value for key, value, _ in stats.entries(stat="elo", queue="ranked") if key.mode != "global"), default=0)
+
+
+# mode -> (title, color, footer, UGC gamemode or None for network-wide stats,
+#          [(label, statistic ID or function of the player's PlayerStats)])
+COMPARE_MODES = {
+    "lifesteal": ("⚔️ Lifesteal Compare", discord.Color.red(), "ArchMC Lifesteal • Bold = higher", "trojan", [
+        ("Kills", "kills"),
+        ("Deaths", "deaths"),
+        ("K/D", "killDeathRatio"),
+        ("Best Streak", "killstreak"),
+    ]),
+    "duels": ("🥊 Duels Compare", discord.Color.blue(), "ArchMC Duels • Bold = higher", None, [
+        ("NoDebuff ELO", "elo:nodebuff:ranked:lifetime"),
+        ("Sumo ELO", "elo:sumo:ranked:lifetime"),
+        ("Bridge ELO", "elo:bridges:ranked:lifetime"),
+        ("NoDebuff Wins", "wins:nodebuff:ranked:lifetime"),
+        ("Best Ranked ELO", best_ranked_elo),
+    ]),
+}
+
+
 class UtilityCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
     @discord.slash_command(
         name="compare",
-        description="Compare two players' stats side by side",
+        description="Compare up to 8 players' stats side by side",
         options=[
             discord.Option(
                 str,
@@ -32,129 +57,131 @@ class UtilityCog(commands.Cog):
             discord.Option(
                 str,
                 "Game mode to compare",
-                choices=["lifesteal", "duels"],
+                choices=list(COMPARE_MODES),
                 required=True,
                 name="mode"
+            ),
+            discord.Option(
+                str,
+                "Another player to compare (optional)",
+                required=False,
+                default=None,
+                name="player3"
+            ),
+            discord.Option(
+                str,
+                "Another player to compare (optional)",
+                required=False,
+                default=None,
+                name="player4"
+            ),
+            discord.Option(
+                str,
+                "Another player to compare (optional)",
+                required=False,
+                default=None,
+                name="player5"
+            ),
+            discord.Option(
+                str,
+                "Another player to compare (optional)",
+                required=False,
+                default=None,
+                name="player6"
+            ),
+            discord.Option(
+                str,
+                "Another player to compare (optional)",
+                required=False,
+                default=None,
+                name="player7"
+            ),
+            discord.Option(
+                str,
+                "Another player to compare (optional)",
+                required=False,
+                default=None,
+                name="player8"
             )
         ]
     )
-    async def compare(self, ctx: discord.ApplicationContext, player1: str, player2: str, mode: str):
+    async def compare(self, ctx: discord.ApplicationContext, player1: str, player2: str, mode: str,
+                      player3: str = None, player4: str = None, player5: str = None,
+                      player6: str = None, player7: str = None, player8: str = None):
+        deadline = Deadline()
         if check_cooldown(ctx.author.id):
             await ctx.respond("Please wait a few seconds before using commands again.", ephemeral=True)
             return
         
-        if contains_mention(player1) or contains_mention(player2):
+        raw_players = [p for p in (player1, player2, player3, player4, player5, player6, player7, player8) if p]
+        if any(contains_mention(p) for p in raw_players):
             await ctx.respond("Please enter valid Minecraft usernames, not Discord mentions.", ephemeral=True)
             return
         
-        p1 = sanitize_username(player1)
-        p2 = sanitize_username(player2)
-        if not p1 or not p2:
+        players = [sanitize_username(p) for p in raw_players]
+        if not all(players):
             await ctx.respond("Invalid username(s). Minecraft usernames can only contain letters, numbers, and underscores (1-16 characters).", ephemeral=True)
             return
-        if is_username_blocked(p1) or is_username_blocked(p2):
+        if any(is_username_blocked(p) for p in players):
             await ctx.respond("One of those usernames cannot be looked up.", ephemeral=True)
             return
+        # Usernames are case-insensitive: keep the first spelling of each player
+        distinct = {}
+        for p in players:
+            distinct.setdefault(p.lower(), p)
+        players = list(distinct.values())
+        if len(players) < 2:
+            await ctx.respond("Need at least two different players to compare.", ephemeral=True)
+            return
         
         await ctx.defer()
         try:
             client = get_api_client()
+            title, color, footer, gamemode, stats_to_compare = COMPARE_MODES[mode]
+            found, missing, failed = await client.get_players_statistics(players, gamemode, deadline=deadline)
             
-            if mode == "lifesteal":
-                stats1, stats2 = await asyncio.gather(
-                    client.get(f"/v1/ugc/trojan/players/username/{p1}/statistics"),
-                    client.get(f"/v1/ugc/trojan/players/username/{p2}/statistics"),
-                    return_exceptions=True
-                )
-                
-                if isinstance(stats1, Exception) or not stats1:
-                    await ctx.respond(f"Could not find stats for **{p1}**.")
-                    return
-                if isinstance(stats2, Exception) or not stats2:
-                    await ctx.respond(f"Could not find stats for **{p2}**.")
-                    return
-                
-                s1 = stats1.get("statistics", {})
-                s2 = stats2.get("statistics", {})
-                
-                def get_val(s, key):
-                    stat = s.get(key, {})
-                    return stat.get("value", 0) if isinstance(stat, dict) else (stat or 0)
-                
-                embed = discord.Embed(
-                    title=f"⚔️ Lifesteal Compare",
-                    description=f"**{p1}** vs **{p2}**",
-                    color=discord.Color.red()
-                )
-                
-                stats_to_compare = [
-                    ("Kills", "kills"),
-                    ("Deaths", "deaths"),
-                    ("K/D", "killDeathRatio"),
-                    ("Best Streak", "killstreak"),
-                ]
-                
-                for label, key in stats_to_compare:
-                    v1 = get_val(s1, key)
-                    v2 = get_val(s2, key)
-                    if v1 > v2:
-                        line = f"**{v1}** vs {v2}"
-                    elif v2 > v1:
-                        line = f"{v1} vs **{v2}**"
-                    else:
-                        line = f"{v1} vs {v2}"
-                    embed.add_field(name=label, value=line, inline=True)
-                
-                embed.set_footer(text="ArchMC Lifesteal • Bold = higher")
-                await ctx.respond(embed=embed)
+            if len(found) < 2:
+                problems = []
+                if missing:
+                    problems.append(f"Could not find stats for {', '.join(f'**{p}**' for p in missing)}.")
+                if failed:
+                    problems.append(f"Couldn't load {', '.join(f'**{p}**' for p in failed)} right now, please try again in a moment.")
+                await ctx.respond(" ".join(problems) or "Could not find stats for those players.")
+                return
             
-            else:
-                stats1, stats2 = await asyncio.gather(
-                    client.get(f"/v1/players/username/{p1}/statistics"),
-                    client.get(f"/v1/players/username/{p2}/statistics"),
-                    return_exceptions=True
-                )
-                
-                if isinstance(stats1, Exception) or not stats1:
-                    await ctx.respond(f"Could not find stats for **{p1}**.")
-                    return
-                if isinstance(stats2, Exception) or not stats2:
-                    await ctx.respond(f"Could not find stats for **{p2}**.")
-                    return
-                
-                s1 = stats1.get("statistics", {})
-                s2 = stats2.get("statistics", {})
-                
-                def get_val(s, key):
-                    stat = s.get(key, {})
-                    return stat.get("value", 0) if isinstance(stat, dict) else (stat or 0)
-                
-                embed = discord.Embed(
-                    title=f"🥊 Duels Compare",
-                    description=f"**{p1}** vs **{p2}**",
-                    color=discord.Color.blue()
-                )
-                
-                duel_stats = [
-                    ("NoDebuff ELO", "elo:nodebuff:ranked:lifetime"),
-                    ("Sumo ELO", "elo:sumo:ranked:lifetime"),
-                    ("Bridge ELO", "elo:bridge:ranked:lifetime"),
-                    ("NoDebuff Wins", "wins:nodebuff:ranked:lifetime"),
-                ]
-                
-                for label, key in duel_stats:
-                    v1 = get_val(s1, key)
-                    v2 = get_val(s2, key)
+            names = list(found)
+            player_stats = list(found.values())
+            
+            embed = discord.Embed(
+                title=title,
+                description=" vs ".join(f"**{name}**" for name in names),
+                color=color
+            )
+            
+            for label, key in stats_to_compare:
+                values = [key(s) if callable(key) else s.value(key) for s in player_stats]
+                if len(names) == 2:
+                    v1, v2 = values
                     if v1 > v2:
                         line = f"**{v1}** vs {v2}"
                     elif v2 > v1:
                         line = f"{v1} vs **{v2}**"
                     else:
                         line = f"{v1} vs {v2}"
-                    embed.add_field(name=label, value=line, inline=True)
-                
-                embed.set_footer(text="ArchMC Duels • Bold = higher")
-                await ctx.respond(embed=embed)
+                else:
+                    best = max(values)
+                    line = "\n".join(
+                        f"**{name}: {value}**" if value == best and values.count(best) < len(values) else f"{name}: {value}"
+                        for name, value in zip(names, values)
+                    )
+                embed.add_field(name=label, value=line, inline=True)
+            
+            if missing:
+                embed.add_field(name="Not found", value=", ".join(missing), inline=False)
+            if failed:
+                embed.add_field(name="Couldn't load (try again)", value=", ".join(failed), inline=False)
+            embed.set_footer(text=footer)
+            await ctx.respond(embed=embed)
                 
         except Exception as e:
             logger.error(f"compare error: {e}")
@@ -246,7 +273,7 @@ class UtilityCog(commands.Cog):
         )
         embed.add_field(
             name="/compare",
-            value="⚔️ Compare two players' stats (Lifesteal or Duels).",
+            value="⚔️ Compare up to 8 players' stats (Lifesteal or Duels).",
             inline=False
         )
         embed.add_field(
@@ -0,0 +1,50 @@
+"""
+Micro-benchmark for utils.codec against the stdlib json module.
+
+Usage: python scripts/bench_codec.py [payload.json] [iterations]
+Decodes and re-encodes a player statistics payload (skywars_stats.json by
+default) with both codecs and prints the per-call time and speed-up.
+"""
+
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils import codec
+
+DEFAULT_PAYLOAD = os.path.join(ROOT, "skywars_stats.json")
+
+
+def bench(label, fn, iterations):
+    seconds = min(timeit.repeat(fn, number=iterations, repeat=5)) / iterations
+    print(f"  {label:<16} {seconds * 1e3:8.3f} ms")
+    return seconds
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PAYLOAD
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw)
+    print(f"{os.path.basename(path)}: {len(raw):,} bytes, codec backend: {codec.BACKEND}")
+
+    print("decode")
+    stdlib_decode = bench("json.loads", lambda: json.loads(raw), iterations)
+    codec_decode = bench("codec.loads", lambda: codec.loads(raw), iterations)
+
+    print("encode")
+    stdlib_encode = bench("json.dumps", lambda: json.dumps(data).encode(), iterations)
+    codec_encode = bench("codec.dumps", lambda: codec.dumps(data), iterations)
+
+    print(f"decode speed-up: {stdlib_decode / codec_decode:.1f}x")
+    print(f"encode speed-up: {stdlib_encode / codec_encode:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from utils.disk_cache import DEFAULT_DISK_CACHE_PATH, DISK_CACHE_ENV, DiskCache, disk_cache_from_env
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1000, evict_every=1000)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_with_wall_clock_expiry(cache):
+    cache.set("GET /v1/guilds/a", b'{"ok": true}', ttl=30, stale_ttl=60)
+    body, expires_at, stale_until = cache.get("GET /v1/guilds/a")
+    assert body == b'{"ok": true}'
+    assert stale_until - expires_at == pytest.approx(60)
+    assert cache.get("GET /v1/guilds/b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_past_their_stale_window_are_misses(cache):
+    cache.set("GET /v1/guilds/a", b"x", ttl=0, stale_ttl=0)
+    assert cache.get("GET /v1/guilds/a") is None
+
+
+def test_entries_survive_reopening(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = DiskCache(path)
+    first.set("GET /v1/guilds/a", b"kept", ttl=30)
+    first.close()
+    second = DiskCache(path)
+    assert second.get("GET /v1/guilds/a")[0] == b"kept"
+    second.close()
+
+
+def test_eviction_drops_least_recently_used_over_budget(cache):
+    for name in "abc":
+        cache.set(f"GET /{name}", b"x" * 400, ttl=30)
+    cache.get("GET /a")
+    cache.evict()
+    assert cache.get("GET /a") is not None
+    assert cache.get("GET /b") is None
+    assert cache.get("GET /c") is not None
+
+
+def test_oversized_bodies_are_not_stored(cache):
+    cache.set("GET /big", b"x" * 1001, ttl=30)
+    assert cache.get("GET /big") is None
+
+
+def test_enabled_through_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv(DISK_CACHE_ENV, raising=False)
+    assert disk_cache_from_env() is None
+    monkeypatch.setenv(DISK_CACHE_ENV, "off")
+    assert disk_cache_from_env() is None
+    monkeypatch.setenv(DISK_CACHE_ENV, "1")
+    assert disk_cache_from_env().path == DEFAULT_DISK_CACHE_PATH
+    custom = os.path.join(str(tmp_path), "custom.sqlite3")
+    monkeypatch.setenv(DISK_CACHE_ENV, custom)
+    assert disk_cache_from_env().path == custom
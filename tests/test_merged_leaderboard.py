@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from utils import merged_leaderboard
+from utils.api_client import ApiError, RateLimitedError
+from utils.merged_leaderboard import MergedLeaderboard, get_merged_leaderboard
+
+
+def path_for(stat_id: str, page: int) -> str:
+    return f"/v1/leaderboards/{stat_id}?page={page}&size=2"
+
+
+class FakeClient:
+    """Serves fixed leaderboards two entries per page, counting fetches and concurrency."""
+
+    def __init__(self, boards, failing=()):
+        self.boards = boards
+        self.failing = set(failing)
+        self.fetched = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def fetch(self, path, priority=None, deadline=None):
+        stat_id, page = path.split("/")[-1].split("?page=")
+        page = int(page.split("&")[0])
+        self.fetched.append((stat_id, page))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if stat_id in self.failing:
+                raise RateLimitedError(path)
+            entries = self.boards[stat_id][page * 2:page * 2 + 2]
+            return {"entries": [{"username": name, "uuid": name.lower(), "value": value} for name, value in entries]}
+        finally:
+            self.in_flight -= 1
+
+
+BOARDS = {
+    "elo:sumo:ranked:lifetime": [("Ann", 2000), ("Bob", 1800), ("Cat", 1500), ("Dan", 1200)],
+    "elo:nodebuff:ranked:lifetime": [("Bob", 1900), ("Eve", 1700), ("Ann", 1600)],
+    "elo:boxing:ranked:lifetime": [("Fay", 1750)],
+}
+
+
+def merged(client, stat_ids=tuple(BOARDS)):
+    return MergedLeaderboard(client, stat_ids, path_for, page_size=2)
+
+
+def test_merges_in_value_order_with_each_player_once_at_their_best():
+    board = merged(FakeClient(BOARDS))
+    rows = asyncio.run(board.top(10))
+    assert [(r["username"], r["value"], r["kit"]) for r in rows] == [
+        ("Ann", 2000, "sumo"), ("Bob", 1900, "nodebuff"), ("Fay", 1750, "boxing"),
+        ("Eve", 1700, "nodebuff"), ("Cat", 1500, "sumo"), ("Dan", 1200, "sumo"),
+    ]
+    assert [r["position"] for r in rows] == list(range(1, 7))
+    assert board.exhausted and not board.partial
+
+
+def test_pages_are_fetched_only_as_the_merge_needs_them():
+    client = FakeClient(BOARDS)
+    board = merged(client)
+
+    async def run():
+        first = await board.top(2)
+        fetched_for_first = list(client.fetched)
+        more = await board.top(4)
+        return first, fetched_for_first, more
+
+    first, fetched_for_first, more = asyncio.run(run())
+    assert [r["username"] for r in first] == ["Ann", "Bob"]
+    # Each source's next entry is still on its first page
+    assert sorted(fetched_for_first) == sorted((stat_id, 0) for stat_id in BOARDS)
+    assert [r["username"] for r in more] == ["Ann", "Bob", "Fay", "Eve"]
+    assert client.fetched[3:] == [("elo:sumo:ranked:lifetime", 1), ("elo:nodebuff:ranked:lifetime", 1)]
+    assert not board.exhausted
+
+
+def test_later_pages_continue_the_same_merge():
+    board = merged(FakeClient(BOARDS))
+
+    async def run():
+        first = await board.top(3)
+        rest = await board.top(3, start=3)
+        return first, rest
+
+    first, rest = asyncio.run(run())
+    assert [r["username"] for r in first + rest] == ["Ann", "Bob", "Fay", "Eve", "Cat", "Dan"]
+
+
+def test_ties_keep_source_order():
+    boards = {"elo:a:ranked:lifetime": [("X", 100)], "elo:b:ranked:lifetime": [("Y", 100)]}
+    rows = asyncio.run(merged(FakeClient(boards), tuple(boards)).top(2))
+    assert [r["username"] for r in rows] == ["X", "Y"]
+
+
+def test_failed_source_is_reported_and_the_rest_still_merge():
+    board = merged(FakeClient(BOARDS, failing={"elo:nodebuff:ranked:lifetime"}))
+    rows = asyncio.run(board.top(10))
+    assert [r["username"] for r in rows] == ["Ann", "Bob", "Fay", "Cat", "Dan"]
+    assert board.partial
+    assert board.failed_sources == ["elo:nodebuff:ranked:lifetime"]
+
+
+def test_every_source_failing_raises():
+    board = merged(FakeClient(BOARDS, failing=set(BOARDS)))
+    with pytest.raises(ApiError):
+        asyncio.run(board.top(10))
+
+
+def test_source_fetches_are_bounded():
+    boards = {f"elo:kit{i}:ranked:lifetime": [(f"P{i}", i)] for i in range(12)}
+    client = FakeClient(boards)
+    asyncio.run(merged(client, tuple(boards)).top(12))
+    assert client.peak <= merged_leaderboard.BATCH_CONCURRENCY
+
+
+def test_partial_boards_are_not_reused(monkeypatch):
+    monkeypatch.setattr(merged_leaderboard, "_merged", {})
+    client = FakeClient(BOARDS)
+    board = get_merged_leaderboard(client, "elo", tuple(BOARDS), path_for)
+    assert get_merged_leaderboard(client, "elo", tuple(BOARDS), path_for) is board
+    board.failed_sources.append("elo:sumo:ranked:lifetime")
+    assert get_merged_leaderboard(client, "elo", tuple(BOARDS), path_for) is not board
@@ -0,0 +1,90 @@
+import pytest
+
+from utils.negative_cache import BloomFilter, NegativeCache
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=2000, error_rate=0.001)
+    items = [f"/v1/players|player{i}" for i in range(2000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    assert bloom.count == 2000
+
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"in{i}")
+    false_positives = sum(f"out{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.03
+
+
+def test_bloom_filter_sizing():
+    bloom = BloomFilter(capacity=50_000, error_rate=0.001)
+    # ~14.4 bits and ~10 hashes per item for 0.1%
+    assert bloom.size == pytest.approx(50_000 * 14.38, rel=0.01)
+    assert bloom.hashes == 10
+    assert bloom.nbytes == (bloom.size + 7) // 8
+
+
+def test_player_lookups_are_remembered_case_insensitively():
+    cache = NegativeCache()
+    cache.record("/v1/players/username/Notch/statistics")
+    assert cache.is_missing("/v1/players/username/notch")
+    assert cache.is_missing("/v1/players/username/NOTCH/statistics")
+    assert not cache.is_missing("/v1/players/username/Jeb_")
+    assert cache.stats()["hits"] == 2
+
+
+def test_families_are_separate():
+    cache = NegativeCache()
+    cache.record("/v1/ugc/trojan/players/username/Steve")
+    assert cache.is_missing("/v1/ugc/trojan/players/username/steve/statistics")
+    assert not cache.is_missing("/v1/players/username/Steve")
+    assert not cache.is_missing("/v1/ugc/other/players/username/Steve")
+
+
+def test_network_wide_miss_answers_every_family():
+    cache = NegativeCache()
+    cache.record("/v1/players/username/Ghost/statistics")
+    assert cache.is_missing("/v1/economy/player/username/ghost")
+    assert cache.is_missing("/v1/guilds/player/username/GHOST")
+    assert cache.is_missing("/v1/ugc/trojan/players/username/Ghost/profile")
+    assert not cache.is_missing("/v1/economy/player/username/Steve")
+
+
+@pytest.mark.parametrize("path", [
+    # Not in a guild / no balance yet: the player may well exist
+    "/v1/guilds/player/username/Steve",
+    "/v1/economy/player/username/Steve",
+    # A missing statistic or profile says nothing about the player
+    "/v1/players/username/Steve/statistics/kills",
+    "/v1/ugc/trojan/players/username/Steve/profile",
+    "/v1/leaderboards/kills",
+])
+def test_only_player_existence_404s_are_recorded(path):
+    cache = NegativeCache()
+    cache.record(path)
+    assert cache.stats()["recorded"] == 0
+    assert not cache.is_missing(path)
+
+
+def test_entries_expire_after_two_generations():
+    cache = NegativeCache(ttl=60)
+    cache.record("/v1/players/username/Steve")
+    cache._rotated_at -= 60
+    # One rotation: still in the previous generation
+    assert cache.is_missing("/v1/players/username/Steve")
+    cache._rotated_at -= 120
+    assert not cache.is_missing("/v1/players/username/Steve")
+
+
+def test_full_generation_rotates_early():
+    cache = NegativeCache(ttl=3600, capacity=10)
+    for i in range(10):
+        cache.record(f"/v1/players/username/p{i}")
+    cache.record("/v1/players/username/late")
+    assert cache._previous is not None
+    assert cache.is_missing("/v1/players/username/p0")
+    assert cache.is_missing("/v1/players/username/late")
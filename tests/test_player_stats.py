@@ -0,0 +1,84 @@
+import sys
+
+from cogs.utility import best_ranked_elo
+from utils.player_stats import PlayerStats, StatKey, parse_stat_id
+
+PAYLOAD = {
+    "uuid": "u1",
+    "username": "Steve",
+    "statistics": {
+        "elo:sumo:ranked:lifetime": {"value": 1200, "position": 40, "percentile": 2.5, "totalPlayers": 9000},
+        "elo:nodebuff:ranked:lifetime": {"value": 1350, "position": 7},
+        "elo:global:ranked:lifetime": {"value": 1500},
+        "elo:sumo:unranked:lifetime": {"value": 1000},
+        "wins:sumo:ranked:lifetime": {"value": 55},
+        "kdr:skywars:global:lifetime": {"value": 1.25},
+        "kills": 12,
+    },
+}
+
+
+def stats() -> PlayerStats:
+    return PlayerStats.from_payload(PAYLOAD)
+
+
+def test_stat_ids_are_parsed_and_interned():
+    key = parse_stat_id("elo:sumo:ranked:lifetime")
+    assert key == StatKey("elo", "sumo", "ranked", "lifetime")
+    assert key.mode is sys.intern("sumo")
+    assert parse_stat_id("kills") == StatKey("kills")
+
+
+def test_single_lookups():
+    s = stats()
+    assert (s.uuid, s.username, len(s)) == ("u1", "Steve", 7)
+    assert s.value("elo:sumo:ranked:lifetime") == 1200
+    assert isinstance(s.value("elo:sumo:ranked:lifetime"), int)
+    assert s.value("kdr:skywars:global:lifetime") == 1.25
+    assert s.value("kills") == 12
+    assert s.value("missing", default=-1) == -1
+    assert s.position("elo:sumo:ranked:lifetime") == 40
+    assert s.position("kills") is None
+    assert s.percentile("elo:sumo:ranked:lifetime") == 2.5
+    assert s.total_players("elo:sumo:ranked:lifetime") == 9000
+    assert s.get("elo:nodebuff:ranked:lifetime") == {
+        "statisticId": "elo:nodebuff:ranked:lifetime", "value": 1350, "position": 7}
+    assert s.get("missing") is None
+
+
+def test_select_by_parts():
+    s = stats()
+    assert s.ranked_elos() == {
+        "elo:sumo:ranked:lifetime": 1200,
+        "elo:nodebuff:ranked:lifetime": 1350,
+        "elo:global:ranked:lifetime": 1500,
+    }
+    assert s.select(mode="sumo") == {
+        "elo:sumo:ranked:lifetime": 1200,
+        "elo:sumo:unranked:lifetime": 1000,
+        "wins:sumo:ranked:lifetime": 55,
+    }
+    assert s.select(stat="wins", mode="nodebuff") == {}
+    assert len(s.select()) == len(s)
+
+
+def test_entries_carry_keys_and_positions():
+    entries = sorted(stats().entries(stat="elo", queue="ranked"), key=lambda e: e[0].mode)
+    assert [(key.mode, value, position) for key, value, position in entries] == [
+        ("global", 1500, None), ("nodebuff", 1350, 7), ("sumo", 1200, 40)]
+
+
+def test_modes():
+    assert stats().modes() == ["global", "nodebuff", "skywars", "sumo"]
+
+
+def test_index_is_rebuilt_after_adding_a_statistic():
+    s = stats()
+    assert "boxing" not in s.modes()
+    s._add("elo:boxing:ranked:lifetime", {"value": 1100})
+    assert s.select(mode="boxing") == {"elo:boxing:ranked:lifetime": 1100}
+
+
+def test_best_ranked_elo_skips_the_global_aggregate():
+    assert best_ranked_elo(stats()) == 1350
+    assert best_ranked_elo(PlayerStats()) == 0
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from utils.rate_limit import (BACKOFF_FACTOR, DEFAULT_RETRY_AFTER, HEADER_LIMIT_HEADROOM, MIN_RATE_PER_MINUTE,
+                              Priority, TokenBucketLimiter, parse_reset, parse_retry_after)
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_parse_reset_delta_epoch_and_milliseconds():
+    assert parse_reset("12") == 12.0
+    assert parse_reset(str(int(time.time()) + 20)) == pytest.approx(20, abs=2)
+    assert parse_reset(str(int((time.time() + 20) * 1000))) == pytest.approx(20, abs=2)
+    assert parse_reset(str(int(time.time()) - 50)) == 0.0
+    assert parse_reset(None) is None
+
+
+def test_limit_header_caps_rate_with_headroom():
+    limiter = TokenBucketLimiter(rate_per_minute=90, burst=10)
+    limiter.observe(200, {"X-RateLimit-Limit": "60"})
+    assert limiter.upstream_limit == 60
+    assert limiter.max_rate * 60 == pytest.approx(60 * HEADER_LIMIT_HEADROOM)
+    assert limiter.rate == limiter.max_rate
+
+
+def test_remaining_header_caps_tokens():
+    limiter = TokenBucketLimiter(rate_per_minute=90, burst=10)
+    limiter.observe(200, {"X-RateLimit-Remaining": "3"})
+    assert limiter.upstream_remaining == 3
+    assert limiter.estimate()["tokens"] <= 3.1
+
+
+def test_exhausted_remaining_pauses_until_reset():
+    limiter = TokenBucketLimiter(rate_per_minute=90, burst=10)
+    limiter.observe(200, {"RateLimit-Remaining": "0", "RateLimit-Reset": "15"})
+    assert limiter.estimate()["paused_for"] == pytest.approx(15, abs=1)
+    assert limiter.estimate()["tokens"] == 0
+
+
+def test_429_backs_off_and_honours_retry_after():
+    limiter = TokenBucketLimiter(rate_per_minute=90, burst=10)
+    limiter.observe(429, {"Retry-After": "8"})
+    assert limiter.throttled == 1
+    assert limiter.rate * 60 == pytest.approx(90 * BACKOFF_FACTOR)
+    assert limiter.estimate()["paused_for"] == pytest.approx(8, abs=1)
+
+
+def test_429_without_retry_after_uses_default_pause():
+    limiter = TokenBucketLimiter(rate_per_minute=90, burst=10)
+    limiter.observe(429, {})
+    assert limiter.estimate()["paused_for"] == pytest.approx(DEFAULT_RETRY_AFTER, abs=1)
+
+
+def test_repeated_429s_never_drop_below_minimum_rate():
+    limiter = TokenBucketLimiter(rate_per_minute=90, burst=10)
+    for _ in range(50):
+        limiter.observe(429, {"Retry-After": "0"})
+    assert limiter.rate * 60 == pytest.approx(MIN_RATE_PER_MINUTE)
+
+
+def test_successes_recover_rate_up_to_max():
+    limiter = TokenBucketLimiter(rate_per_minute=90, burst=10)
+    limiter.observe(429, {"Retry-After": "0"})
+    backed_off = limiter.rate
+    limiter.observe(200, {})
+    assert backed_off < limiter.rate < limiter.max_rate
+    for _ in range(1000):
+        limiter.observe(200, {})
+    assert limiter.rate == limiter.max_rate
+
+
+def test_burst_is_granted_immediately_then_callers_wait():
+    async def run():
+        limiter = TokenBucketLimiter(rate_per_minute=60, burst=3)
+        granted = [await limiter.acquire(timeout=0.05) for _ in range(3)]
+        late = await limiter.acquire(timeout=0.05)
+        return granted, late, limiter
+
+    granted, late, limiter = asyncio.run(run())
+    assert granted == [True, True, True]
+    assert late is False
+    assert limiter.timeouts == 1
+
+
+def test_queued_callers_are_served_by_priority():
+    async def run():
+        limiter = TokenBucketLimiter(rate_per_minute=600, burst=1)
+        assert await limiter.acquire()
+        order = []
+
+        async def wait(priority, name):
+            if await limiter.acquire(priority, timeout=2):
+                order.append(name)
+
+        # Queued first, but background
+        background = asyncio.create_task(wait(Priority.BACKGROUND, "background"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(wait(Priority.INTERACTIVE, "interactive"))
+        await asyncio.gather(background, interactive)
+        return order
+
+    assert asyncio.run(run()) == ["interactive", "background"]
@@ -0,0 +1,168 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utils.api_client import ApiUnavailableError, AsyncPIGDIClient, CircuitOpenError, cache_key
+from utils.resilience import CircuitBreaker, RetryPolicy, route_family
+
+
+def open_breaker(threshold=3, reset_timeout=30.0) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_timeout=reset_timeout)
+    for _ in range(threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+    return breaker
+
+
+def expire(breaker: CircuitBreaker):
+    breaker.opened_at -= breaker.reset_timeout
+
+
+def test_opens_after_threshold_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 1
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_breaker_rejects_calls():
+    breaker = open_breaker()
+    assert breaker.is_open()
+    assert not breaker.allow()
+    assert not breaker.allow()
+    assert breaker.rejected == 2
+
+
+def test_half_open_lets_one_trial_through():
+    breaker = open_breaker()
+    expire(breaker)
+    assert not breaker.is_open()
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_successful_trial_closes():
+    breaker = open_breaker()
+    expire(breaker)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens():
+    breaker = open_breaker()
+    expire(breaker)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open()
+    assert breaker.times_opened == 2
+
+
+def test_released_trial_lets_the_next_caller_try():
+    breaker = open_breaker()
+    expire(breaker)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_abandoned_trial_stops_blocking_after_reset_timeout():
+    breaker = open_breaker()
+    expire(breaker)
+    assert breaker.allow()
+    breaker._trial_started -= breaker.reset_timeout
+    assert breaker.allow()
+
+
+def test_backoff_stays_within_bounds():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoff(attempt) <= min(4.0, 0.5 * 2 ** (attempt - 1))
+    assert policy.is_retryable_status(503)
+    assert not policy.is_retryable_status(404)
+
+
+@pytest.mark.parametrize("path, family", [
+    ("/v1/ugc/trojan/leaderboard/kills", "ugc"),
+    ("/v1/players/username/Steve/statistics", "players"),
+    ("/v1/guilds?page=0", "guilds"),
+    ("/", "default"),
+])
+def test_route_family(path, family):
+    assert route_family(path) == family
+
+
+def test_fetch_records_one_failure_per_call_after_retries(monkeypatch):
+    """Three 5xx attempts of one GET are one failed call, not three."""
+    async def run():
+        hits = []
+
+        async def unavailable(request):
+            hits.append(request.path)
+            return web.Response(status=503)
+
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", unavailable)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            client = AsyncPIGDIClient("test-key")
+            client.BASE_URL = str(server.make_url("")).rstrip("/")
+            client.retry_policy = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.01)
+
+            async def get_session():
+                return session
+            monkeypatch.setattr(client, "_get_session", get_session)
+
+            breaker = client._breaker("/v1/economy/a")
+            breaker.failure_threshold = 2
+            with pytest.raises(ApiUnavailableError):
+                await client._fetch("GET", "/v1/economy/a")
+            assert len(hits) == 3
+            assert (breaker.state, breaker.failures) == (CircuitBreaker.CLOSED, 1)
+
+            with pytest.raises(ApiUnavailableError):
+                await client._fetch("GET", "/v1/economy/b")
+            assert breaker.state == CircuitBreaker.OPEN
+            with pytest.raises(CircuitOpenError):
+                await client._fetch("GET", "/v1/economy/c")
+            assert len(hits) == 6
+
+    asyncio.run(run())
+
+
+def test_open_breaker_keeps_serving_the_last_known_value():
+    """An entry past its stale window is the fallback for every caller during an outage, not just the first."""
+    async def run():
+        client = AsyncPIGDIClient("test-key")
+        path = "/v1/guilds/name/Foo"
+        client.cache.set(cache_key("GET", path), {"name": "Foo"}, ttl=0, stale_ttl=0)
+        breaker = client._breaker(path)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        assert breaker.is_open()
+        assert await client._call("GET", path) == {"name": "Foo"}
+        assert await client._call("GET", path) == {"name": "Foo"}
+        with pytest.raises(CircuitOpenError):
+            await client._call("GET", "/v1/guilds/name/Bar")
+
+    asyncio.run(run())
@@ -1,115 +1,561 @@
 import os
+import re
 import aiohttp
 import asyncio
 import logging
 import time
-from typing import Optional, Dict, Any
-from collections import deque
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+
+from . import codec
+from .cache import ResponseCache
+from .singleflight import SingleFlight
+from .rate_limit import TokenBucketLimiter, Priority, DEFAULT_MAX_WAIT
+from .resilience import RetryPolicy, CircuitBreaker, route_family
+from .http_pool import get_http_pool
+from .disk_cache import DiskCache, disk_cache_from_env
+from .negative_cache import NegativeCache
+from .player_index import PlayerIndex, get_player_index
+from .player_stats import PlayerStats
+from .stats_store import PlayerStatsStore
+from .deadline import Deadline
 
 logger = logging.getLogger('archie-bot')
 
-# Global rate limiter: 90 requests per 60 seconds (buffer under 100/min limit)
+class ApiError(Exception):
+    """An API request that produced no usable data."""
+
+    def __init__(self, path: str, status: Optional[int] = None):
+        super().__init__(f"{path} ({status})" if status else path)
+        self.path = path
+        self.status = status
+
+class NotFoundError(ApiError):
+    """The API answered 404 (or a recent 404 is remembered)."""
+
+class RateLimitedError(ApiError):
+    """Throttled upstream (429) or no rate limit token became available in time."""
+
+class ApiTimeoutError(ApiError):
+    """Every attempt timed out."""
+
+class ApiUnavailableError(ApiError):
+    """5xx responses or connection errors."""
+
+class CircuitOpenError(ApiError):
+    """The route family's circuit breaker is open and nothing cached could be served."""
+
+# Global rate limiter: 90 requests per 60 seconds plus a burst of 10 (stays under the 100/min limit).
+# Callers queue for a token by priority instead of being turned away. The rate is only a starting
+# point: it follows the API's rate-limit headers and backs off on 429s.
 MAX_REQUESTS_PER_MINUTE = 90
-_request_timestamps: deque = deque()
-_rate_limit_lock = asyncio.Lock()
-
-async def check_global_rate_limit() -> bool:
-    """Returns True if we should proceed, False if rate limited."""
-    async with _rate_limit_lock:
-        now = time.time()
-        # Remove timestamps older than 60 seconds
-        while _request_timestamps and _request_timestamps[0] < now - 60:
-            _request_timestamps.popleft()
-        
-        if len(_request_timestamps) >= MAX_REQUESTS_PER_MINUTE:
-            return False
-        
-        _request_timestamps.append(now)
-        return True
+RATE_LIMIT_BURST = 10
+rate_limiter = TokenBucketLimiter(MAX_REQUESTS_PER_MINUTE, RATE_LIMIT_BURST)
 
-STEVE_HEAD_URL = "https://mc-heads.net/avatar/MHF_Steve/80"
+# Uncached requests a single batch (fetch_many) keeps in flight at once
+BATCH_CONCURRENCY = 4
 
-_http_session: Optional[aiohttp.ClientSession] = None
+# Response cache TTLs per route: (pattern, ttl seconds, extra stale-while-revalidate seconds).
+# First match wins; paths matching nothing are not cached.
+CACHE_TTL_RULES = [
+    (re.compile(r"^/v1/ugc/[^/]+/leaderboard/"), 120, 600),
+    (re.compile(r"^/v1/leaderboards/"), 120, 600),
+    (re.compile(r"^/v1/economy/baltop/"), 120, 600),
+    (re.compile(r"^/v1/ugc/[^/]+/clans"), 300, 900),
+    (re.compile(r"^/v1/guilds/"), 120, 300),
+    (re.compile(r"^/v1/ugc/[^/]+/players/"), 30, 90),
+    (re.compile(r"^/v1/players/"), 30, 90),
+    (re.compile(r"^/v1/economy/player/"), 30, 90),
+]
+
+def get_cache_ttl(path: str) -> Optional[Tuple[int, int]]:
+    """Returns (ttl, stale_ttl) for a path, or None if it shouldn't be cached."""
+    for pattern, ttl, stale_ttl in CACHE_TTL_RULES:
+        if pattern.match(path):
+            return ttl, stale_ttl
+    return None
+
+# The username in player paths; usernames are case-insensitive, so it's lowercased in cache keys
+USERNAME_SEGMENT_REGEX = re.compile(r"(/username/)([^/?]+)")
+
+def cache_key(method: str, path: str) -> str:
+    """Response cache and in-flight key for a request: "Foo" and "foo" share one entry."""
+    return f"{method} {USERNAME_SEGMENT_REGEX.sub(lambda m: m[1] + m[2].lower(), path)}"
+
+# Head mirrors, tried in order; a slow one gets a hedged request to the next
+HEAD_URLS = (
+    "https://mc-heads.net/avatar/{uuid}/80",
+    "https://crafatar.com/avatars/{uuid}?size=80&overlay",
+)
+HEAD_TIMEOUT = 5.0
+# Start the next mirror if the ones in flight haven't answered within this long
+HEAD_HEDGE_DELAY = 0.75
+# After this long a card stops waiting and uses the bundled Steve head
+HEAD_LATENCY_CAP = 2.5
+STEVE_HEAD_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "steve_head.png")
+
+_default_head: Optional[bytes] = None
+
+def get_default_head() -> bytes:
+    """The bundled Steve head PNG."""
+    global _default_head
+    if _default_head is None:
+        with open(STEVE_HEAD_PATH, "rb") as f:
+            _default_head = f.read()
+    return _default_head
 
 async def get_http_session() -> aiohttp.ClientSession:
-    """Get or create global HTTP session."""
-    global _http_session
-    if _http_session is None or _http_session.closed:
-        _http_session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=5),
-            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
-        )
-    return _http_session
-
-async def fetch_player_head(uuid: str) -> Optional[bytes]:
-    """Async fetch player head with timeout protection."""
-    head_urls = [f"https://mc-heads.net/avatar/{uuid}/80", STEVE_HEAD_URL]
+    """Get the shared-pool session used for non-API requests (player heads, server status)."""
+    return get_http_pool().session("http", timeout=5)
+
+_head_flight = SingleFlight()
+
+async def fetch_player_head(uuid: str, deadline: Optional[Deadline] = None) -> bytes:
+    """Fetch a player's head PNG, falling back to the bundled Steve head.
+
+    Waits at most HEAD_LATENCY_CAP (or what's left of `deadline`, if less).
+    Concurrent fetches of the same UUID share one download, which keeps
+    going for the others if one caller gives up.
+    """
+    cap = HEAD_LATENCY_CAP if deadline is None else deadline.timeout(HEAD_LATENCY_CAP)
+    if cap <= 0:
+        return get_default_head()
+    try:
+        head = await asyncio.wait_for(_head_flight.do(uuid, lambda: _fetch_player_head(uuid)), cap)
+    except asyncio.TimeoutError:
+        head = None
+    return head or get_default_head()
+
+async def _fetch_player_head(uuid: str) -> Optional[bytes]:
+    """Hedged download: first good answer from any mirror wins, the rest are cancelled."""
     session = await get_http_session()
-    for url in head_urls:
-        try:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.read()
-                    if len(data) > 100:
-                        return data
-        except:
-            continue
-    return None
+    urls = [template.format(uuid=uuid) for template in HEAD_URLS]
+    pending: set = set()
+    try:
+        while urls or pending:
+            if urls:
+                pending.add(asyncio.create_task(_download_head(session, urls.pop(0))))
+            done, pending = await asyncio.wait(pending, timeout=HEAD_HEDGE_DELAY if urls else None,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.result():
+                    return task.result()
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
 
+async def _download_head(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=HEAD_TIMEOUT)) as resp:
+            if resp.status == 200:
+                data = await resp.read()
+                if len(data) > 100:
+                    return data
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        pass
+    return None
 
 class AsyncPIGDIClient:
     """Async API client - prevents blocking the event loop."""
     BASE_URL = "https://api.arch.mc"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, disk_cache: Optional[DiskCache] = None, player_index: Optional[PlayerIndex] = None):
         self.api_key = api_key
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.player_index = player_index
+        self.cache = ResponseCache()
+        self.disk_cache = disk_cache
+        self._refreshing: set = set()
+        self._background_tasks: set = set()
+        self._flight = SingleFlight()
+        self.retry_policy = RetryPolicy()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.negative_cache = NegativeCache()
+        self.player_stats = PlayerStatsStore()
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(
-                headers={"X-API-KEY": self.api_key},
-                timeout=timeout
-            )
-        return self._session
-
-    async def _request(self, method: str, path: str) -> Any:
-        # Check global rate limit before making request
-        if not await check_global_rate_limit():
-            logger.warning(f"Global rate limit reached, skipping: {path}")
+        return get_http_pool().session("archmc", timeout=30, headers={"X-API-KEY": self.api_key})
+
+    async def _request(self, method: str, path: str, priority: Priority = Priority.INTERACTIVE,
+                       deadline: Optional[Deadline] = None) -> Any:
+        """Like `_call`, but returns None on any API failure."""
+        try:
+            return await self._call(method, path, priority, deadline)
+        except ApiError:
             return None
-        
-        session = await self._get_session()
-        url = f"{self.BASE_URL}{path}"
+
+    async def _call(self, method: str, path: str, priority: Priority = Priority.INTERACTIVE,
+                    deadline: Optional[Deadline] = None) -> Any:
+        """Serve a request from the caches or the API. Raises an ApiError subclass on failure.
+
+        With a `deadline`, waits no longer than the interaction's remaining
+        budget and falls back to expired cached data rather than failing.
+        """
+        if method == "GET" and self.negative_cache.is_missing(path):
+            raise NotFoundError(path)
+
+        ttl = get_cache_ttl(path) if method == "GET" else None
+        if ttl is None:
+            try:
+                result, _ = await self._fetch(method, path, priority, deadline=deadline)
+            except NotFoundError:
+                self.negative_cache.record(path)
+                raise
+            self._index_players(result)
+            return result
+
+        key = cache_key(method, path)
+        breaker_open = self._breaker(path).is_open()
+        # Whatever we last had, even past its stale window: the fallback when the API can't answer in time
+        last_known = self.cache.peek(key)
+        cached = self.cache.get(key)
+        if cached is not None:
+            value, fresh = cached
+            if not fresh and not breaker_open:
+                self._schedule_refresh(method, path, key)
+            return value
+
+        if breaker_open:
+            # Backend is failing: answer with whatever we last had instead of waiting on it
+            if last_known is None:
+                raise CircuitOpenError(path)
+            return last_known
+
+        # Identical concurrent misses share one request (and one rate-limit slot)
+        load = self._flight.do(key, lambda: self._load(method, path, key, priority, deadline=deadline))
+        if deadline is None:
+            return await load
         try:
-            async with session.request(method, url) as resp:
-                if resp.status != 200:
-                    return None
-                if resp.content_type and resp.content_type.startswith("application/json"):
-                    return await resp.json()
-                return await resp.text()
+            # The shared load keeps going (and fills the cache) if this caller runs out of time
+            return await asyncio.wait_for(load, deadline.remaining())
         except asyncio.TimeoutError:
-            logger.warning(f"API timeout: {path}")
-            return None
-        except Exception as e:
-            logger.error(f"API error: {e}")
-            return None
+            error: ApiError = ApiTimeoutError(path)
+        except (ApiTimeoutError, RateLimitedError, ApiUnavailableError) as e:
+            error = e
+        if last_known is None:
+            raise error
+        logger.info(f"Out of time for {path}, answering from expired cache")
+        return last_known
+
+    async def _load(self, method: str, path: str, key: str, priority: Priority, use_disk: bool = True,
+                    deadline: Optional[Deadline] = None) -> Any:
+        """Fetch a path (disk cache first, if enabled) and store a successful result in the caches."""
+        ttl, stale_ttl = get_cache_ttl(path)
+        if use_disk and self.disk_cache is not None:
+            hit = await asyncio.to_thread(self.disk_cache.get, key)
+            if hit is not None:
+                body, expires_at, stale_until = hit
+                try:
+                    result = codec.loads(body)
+                except ValueError:
+                    result = None
+                if result is not None:
+                    now = time.time()
+                    self.cache.set(key, result, max(0.0, expires_at - now), stale_until - max(now, expires_at), len(body))
+                    if expires_at <= now:
+                        self._schedule_refresh(method, path, key)
+                    return result
+
+        try:
+            result, body = await self._fetch(method, path, priority, deadline=deadline)
+        except NotFoundError:
+            self.negative_cache.record(path)
+            self.cache.invalidate(key)
+            raise
+        self.cache.set(key, result, ttl, stale_ttl, len(body))
+        self._index_players(result)
+        if self.disk_cache is not None and not isinstance(result, str):
+            self._spawn(asyncio.to_thread(self.disk_cache.set, key, body, ttl, stale_ttl))
+        return result
+
+    def _index_players(self, result: Any):
+        """Learn username -> UUID pairs from a fresh response."""
+        if self.player_index is None:
+            return
+        self.player_index.observe(result)
+        if self.player_index.needs_flush():
+            self._spawn(self.player_index.flush())
+
+    def lookup_uuid(self, username: str) -> Optional[str]:
+        """UUID of a player we've seen before, without an API call."""
+        return self.player_index.get_uuid(username) if self.player_index is not None else None
+
+    def _spawn(self, coro):
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _schedule_refresh(self, method: str, path: str, key: str):
+        """Refresh a stale entry in the background, at most once per key at a time."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self._spawn(self._refresh(method, path, key))
+
+    async def _refresh(self, method: str, path: str, key: str):
+        try:
+            # Not coalesced: callers keep getting the stale L1 entry while this runs
+            await self._load(method, path, key, Priority.BACKGROUND, use_disk=False)
+        except ApiError:
+            pass
+        finally:
+            self._refreshing.discard(key)
+
+    async def prefetch(self, path: str, priority: Priority = Priority.BACKGROUND, min_fresh: float = 0.0) -> bool:
+        """Load a GET path into the cache ahead of demand.
+
+        Skipped (returning False) when the cached entry stays fresh for at
+        least `min_fresh` seconds, a refresh of it is already running, the
+        path isn't cacheable or its circuit is open. Readers keep getting the
+        cached value while this runs.
+        """
+        key = cache_key("GET", path)
+        remaining = self.cache.expires_in(key)
+        if remaining is not None and remaining > min_fresh:
+            return False
+        if key in self._refreshing or get_cache_ttl(path) is None or self._breaker(path).is_open():
+            return False
+        self._refreshing.add(key)
+        try:
+            await self._load("GET", path, key, priority, use_disk=remaining is None)
+            return True
+        except ApiError as e:
+            logger.debug(f"Prefetch failed for {path}: {e}")
+            return False
+        finally:
+            self._refreshing.discard(key)
+
+    def _breaker(self, path: str) -> CircuitBreaker:
+        family = route_family(path)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = self._breakers[family] = CircuitBreaker()
+        return breaker
+
+    async def _fetch(self, method: str, path: str, priority: Priority = Priority.INTERACTIVE,
+                     deadline: Optional[Deadline] = None) -> Tuple[Any, bytes]:
+        """Hit the API. Returns (result, raw body) or raises an ApiError subclass.
+
+        GETs are retried on 5xx and timeouts with jittered backoff until the
+        retry policy's deadline (or the interaction's `deadline`, if sooner).
+        The route family's circuit breaker short-circuits calls while open and
+        is fed one outcome per call, once its retries are over, so a single
+        struggling request doesn't count as several failures.
+        """
+        policy = self.retry_policy
+        breaker = self._breaker(path)
+        loop = asyncio.get_running_loop()
+        budget = policy.deadline if deadline is None else deadline.timeout(policy.deadline)
+        give_up_at = loop.time() + budget
+        attempts = policy.max_attempts if method == "GET" else 1
+        session = await self._get_session()
+        url = f"{self.BASE_URL}{path}"
+        error: ApiError = ApiTimeoutError(path)
+
+        if not breaker.allow():
+            logger.warning(f"Circuit open for {route_family(path)}, failing fast: {path}")
+            raise CircuitOpenError(path)
+        for attempt in range(1, attempts + 1):
+            # Wait for a global rate limit token before making request
+            remaining = give_up_at - loop.time()
+            if remaining <= 0 or not await rate_limiter.acquire(priority, min(DEFAULT_MAX_WAIT[priority], remaining)):
+                # Earlier attempts failed on the backend; this one just never got to go
+                if attempt > 1:
+                    breaker.record_failure()
+                else:
+                    breaker.release()
+                logger.warning(f"Timed out waiting for rate limit token, skipping: {path}")
+                raise RateLimitedError(path)
 
-    async def get_ugc_player_stats_by_username(self, gamemode: str, username: str) -> Optional[Dict]:
+            timeout = aiohttp.ClientTimeout(total=max(0.1, min(policy.attempt_timeout, give_up_at - loop.time())))
+            try:
+                async with session.request(method, url, timeout=timeout) as resp:
+                    rate_limiter.observe(resp.status, resp.headers)
+                    if resp.status == 429:
+                        breaker.release()
+                        logger.warning(f"API rate limited (429), backing off: {path}")
+                        raise RateLimitedError(path, 429)
+                    if policy.is_retryable_status(resp.status):
+                        logger.warning(f"API {resp.status} (attempt {attempt}/{attempts}): {path}")
+                        error = ApiUnavailableError(path, resp.status)
+                    else:
+                        breaker.record_success()
+                        if resp.status == 404:
+                            raise NotFoundError(path, 404)
+                        if resp.status != 200:
+                            raise ApiError(path, resp.status)
+                        body = await resp.read()
+                        if resp.content_type and resp.content_type.startswith("application/json"):
+                            return codec.loads(body), body
+                        return body.decode(resp.get_encoding()), body
+            except ApiError:
+                raise
+            except asyncio.TimeoutError:
+                logger.warning(f"API timeout (attempt {attempt}/{attempts}): {path}")
+                error = ApiTimeoutError(path)
+            except aiohttp.ClientError as e:
+                breaker.record_failure()
+                logger.error(f"API error: {e}")
+                raise ApiUnavailableError(path) from e
+            except Exception as e:
+                breaker.release()
+                logger.error(f"API error: {e}")
+                raise ApiError(path) from e
+
+            if attempt < attempts:
+                delay = policy.backoff(attempt)
+                # Other calls may have opened the circuit meanwhile; don't keep hammering it
+                if loop.time() + delay >= give_up_at or breaker.is_open():
+                    break
+                await asyncio.sleep(delay)
+        if breaker.is_open():
+            # Already opened by other calls; recording again would only push its retry back
+            breaker.release()
+        else:
+            breaker.record_failure()
+        raise error
+
+    def cache_stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats()
+        stats["coalesced"] = self._flight.shared
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats()
+        stats["negative"] = self.negative_cache.stats()
+        stats["players"] = self.player_stats.stats()
+        return stats
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        return rate_limiter.stats()
+
+    def rate_limit_estimate(self) -> Dict[str, Any]:
+        return rate_limiter.estimate()
+
+    def breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {family: breaker.stats() for family, breaker in self._breakers.items()}
+
+    async def get_ugc_player_stats_by_username(self, gamemode: str, username: str, priority: Priority = Priority.INTERACTIVE,
+                                               deadline: Optional[Deadline] = None) -> Optional[Dict]:
         path = f"/v1/ugc/{gamemode}/players/username/{username}/statistics"
-        return await self._request("GET", path)
+        return await self._request("GET", path, priority, deadline=deadline)
 
-    async def get_ugc_leaderboard(self, gamemode: str, stat_type: str, page: int = 0, size: int = 10) -> Optional[Dict]:
+    async def get_ugc_leaderboard(self, gamemode: str, stat_type: str, page: int = 0, size: int = 10, priority: Priority = Priority.INTERACTIVE) -> Optional[Dict]:
         path = f"/v1/ugc/{gamemode}/leaderboard/{stat_type}?page={page}&size={size}"
-        return await self._request("GET", path)
+        return await self._request("GET", path, priority)
+
+    async def get(self, path: str, priority: Priority = Priority.INTERACTIVE,
+                  deadline: Optional[Deadline] = None) -> Optional[Dict]:
+        return await self._request("GET", path, priority, deadline)
+
+    async def fetch(self, path: str, priority: Priority = Priority.INTERACTIVE,
+                    deadline: Optional[Deadline] = None) -> Any:
+        """Like `get`, but raises NotFoundError, RateLimitedError, ApiTimeoutError, ... instead of returning None."""
+        return await self._call("GET", path, priority, deadline)
+
+    async def fetch_many(self, paths: Iterable[str], priority: Priority = Priority.INTERACTIVE,
+                         concurrency: int = BATCH_CONCURRENCY, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Fetch several GET paths. Returns {path: result or the ApiError it raised}.
+
+        Repeated paths are fetched once. Paths already in the cache are
+        answered straight away; at most `concurrency` of the others are in
+        flight at a time, so a batch can't eat the whole rate budget.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(path: str) -> Any:
+            try:
+                if self.cache.expires_in(cache_key("GET", path)) is not None:
+                    return await self._call("GET", path, priority, deadline)
+                async with semaphore:
+                    return await self._call("GET", path, priority, deadline)
+            except ApiError as e:
+                return e
+
+        unique = list(dict.fromkeys(paths))
+        results = await asyncio.gather(*(one(path) for path in unique))
+        return dict(zip(unique, results))
+
+    async def get_player_stats(self, username: str, priority: Priority = Priority.INTERACTIVE,
+                               deadline: Optional[Deadline] = None) -> PlayerStats:
+        """Network-wide statistics of a player, decoded once and shared by every command.
+
+        Raises an ApiError subclass if they can't be fetched and nothing
+        (even stale) is stored for the player.
+        """
+        stats = self.player_stats.get(username)
+        if stats is not None:
+            return stats
+        path = f"/v1/players/username/{username}/statistics"
+        try:
+            return await self._flight.do(f"stats {username.lower()}",
+                                         lambda: self._load_player_stats(username, path, priority, deadline))
+        except (ApiTimeoutError, RateLimitedError, ApiUnavailableError, CircuitOpenError):
+            stats = self.player_stats.peek(username)
+            if stats is None:
+                raise
+            return stats
+
+    async def _load_player_stats(self, username: str, path: str, priority: Priority,
+                                 deadline: Optional[Deadline] = None) -> PlayerStats:
+        return self._store_player_stats(username, path, await self._call("GET", path, priority, deadline=deadline))
+
+    def _store_player_stats(self, username: str, path: str, payload: Any) -> PlayerStats:
+        """Decode a statistics payload into the player store, as fresh as the cached response it came from."""
+        if not isinstance(payload, dict):
+            raise ApiError(path)
+        stats = PlayerStats.from_payload(payload)
+        ttl, stale_ttl = get_cache_ttl(path)
+        remaining = self.cache.expires_in(cache_key("GET", path))
+        if remaining is None:
+            remaining = ttl
+        self.player_stats.put(username, stats, max(0.0, remaining), stale_ttl, ttl - remaining)
+        return stats
+
+    async def get_players_statistics(self, usernames: Iterable[str], gamemode: Optional[str] = None,
+                                     priority: Priority = Priority.INTERACTIVE,
+                                     deadline: Optional[Deadline] = None
+                                     ) -> Tuple[Dict[str, PlayerStats], List[str], List[str]]:
+        """Statistics for several players: ({username: PlayerStats}, [not found], [failed to load]).
 
-    async def get(self, path: str) -> Optional[Dict]:
-        return await self._request("GET", path)
+        Network-wide statistics by default (shared with get_player_stats), or
+        a UGC gamemode's (e.g. "trojan"). Usernames are de-duplicated
+        case-insensitively, keeping the first spelling. "Failed to load" are
+        the transient errors (rate limited, timed out, API down) worth retrying.
+        """
+        names: Dict[str, str] = {}
+        for name in usernames:
+            names.setdefault(name.lower(), name)
+        found: Dict[str, PlayerStats] = {}
+        if gamemode is None:
+            for name in names.values():
+                stats = self.player_stats.get(name)
+                if stats is not None:
+                    found[name] = stats
+        prefix = f"/v1/ugc/{gamemode}/players" if gamemode else "/v1/players"
+        paths = {name: f"{prefix}/username/{name}/statistics" for name in names.values() if name not in found}
+        results = await self.fetch_many(paths.values(), priority, deadline=deadline)
+        missing, failed = [], []
+        for name, path in paths.items():
+            result = results[path]
+            if isinstance(result, NotFoundError) or not isinstance(result, (dict, ApiError)):
+                missing.append(name)
+            elif isinstance(result, ApiError):
+                failed.append(name)
+            elif gamemode is None:
+                found[name] = self._store_player_stats(name, path, result)
+            else:
+                found[name] = PlayerStats.from_payload(result)
+        # Keep the order the names were given in
+        return {name: found[name] for name in names.values() if name in found}, missing, failed
 
     async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Stop background refreshes. The HTTP session belongs to the shared pool, closed on shutdown."""
+        for task in list(self._background_tasks):
+            task.cancel()
+        if self.player_index is not None:
+            await self.player_index.flush()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
 
 
 _api_client: Optional[AsyncPIGDIClient] = None
@@ -118,5 +564,5 @@ def get_api_client() -> AsyncPIGDIClient:
     global _api_client
     if _api_client is None:
         API_KEY = os.getenv("ARCH_API_KEY") or "your-api-key-here"
-        _api_client = AsyncPIGDIClient(API_KEY)
+        _api_client = AsyncPIGDIClient(API_KEY, disk_cache=disk_cache_from_env(), player_index=get_player_index())
     return _api_client
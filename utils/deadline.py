@@ -0,0 +1,44 @@
+import time
+from typing import Optional
+
+# Latency target for a slash command, from the moment it starts until it responds
+INTERACTION_BUDGET = 8.0
+# Time kept back from the network stages of a card command so the card still gets drawn
+RENDER_RESERVE = 1.5
+
+
+class Deadline:
+    """Time budget for one interaction, shared by every stage that serves it.
+
+    Each network stage (API call, head fetch) bounds its own timeouts with
+    `timeout()` and gives up, or falls back to cached or placeholder data,
+    once the budget is spent. Rendering isn't cut short: it runs on data
+    already fetched.
+    """
+    __slots__ = ("started", "expires_at")
+
+    def __init__(self, budget: float = INTERACTION_BUDGET, expires_at: Optional[float] = None):
+        self.started = time.monotonic()
+        self.expires_at = self.started + budget if expires_at is None else expires_at
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def timeout(self, cap: float) -> float:
+        """A stage's own timeout `cap`, shortened to what's left of the budget."""
+        return min(cap, self.remaining())
+
+    def reserving(self, seconds: float) -> "Deadline":
+        """The same deadline, ending `seconds` earlier (for stages that must leave time for later ones)."""
+        deadline = Deadline(expires_at=self.expires_at - seconds)
+        deadline.started = self.started
+        return deadline
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.2f}s)"
@@ -0,0 +1,134 @@
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Optional, Tuple
+
+logger = logging.getLogger('archie-bot')
+
+# Set ARCHIE_DISK_CACHE=1 (or to a file path) to enable the on-disk response cache
+DISK_CACHE_ENV = "ARCHIE_DISK_CACHE"
+DEFAULT_DISK_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api_cache.sqlite3")
+DEFAULT_DISK_CACHE_BYTES = 128 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+class DiskCache:
+    """SQLite (WAL mode) second-tier response cache, safe to share between processes.
+
+    Stores raw response bodies with wall-clock expiry so entries survive
+    restarts. Methods are blocking; call them from a worker thread.
+    """
+
+    def __init__(self, path: str = DEFAULT_DISK_CACHE_PATH, max_bytes: int = DEFAULT_DISK_CACHE_BYTES,
+                 evict_every: int = 50):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evict_every = evict_every
+        self._local = threading.local()
+        self._conns = []
+        self._conns_lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float, float]]:
+        """Returns (body, expires_at, stale_until) as wall-clock times, or None."""
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT body, expires_at, stale_until FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] <= now:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        self.hits += 1
+        return bytes(row[0]), row[1], row[2]
+
+    def set(self, key: str, body: bytes, ttl: float, stale_ttl: float = 0):
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, expires_at, stale_until, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, len(body), now + ttl, now + ttl + stale_ttl, now),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed: {e}")
+            return
+        self._writes += 1
+        if self._writes % self.evict_every == 0:
+            self.evict()
+
+    def evict(self):
+        """Drop dead entries, then least recently used ones until under max_bytes."""
+        try:
+            conn = self._conn()
+            cur = conn.execute("DELETE FROM responses WHERE stale_until <= ?", (time.time(),))
+            self.evictions += max(cur.rowcount, 0)
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            excess = total - self.max_bytes
+            rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+            doomed = []
+            for key, size in rows:
+                if excess <= 0:
+                    break
+                doomed.append((key,))
+                excess -= size
+            conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            self.evictions += len(doomed)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache eviction failed: {e}")
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def close(self):
+        with self._conns_lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+        self._local = threading.local()
+
+
+def disk_cache_from_env() -> Optional[DiskCache]:
+    """Build the disk cache if it's switched on through the environment."""
+    setting = os.getenv(DISK_CACHE_ENV, "").strip()
+    if not setting or setting.lower() in ("0", "false", "no", "off"):
+        return None
+    path = DEFAULT_DISK_CACHE_PATH if setting.lower() in ("1", "true", "yes", "on") else setting
+    return DiskCache(path)
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional
+
+import aiohttp
+
+logger = logging.getLogger('archie-bot')
+
+# Hosts we talk to on almost every command; warmed up in on_ready
+WARM_UP_URLS = [
+    "https://api.arch.mc/",
+    "https://mc-heads.net/",
+    "https://api.mcsrvstat.us/",
+]
+
+
+class HttpPool:
+    """One keep-alive connection pool shared by every outbound aiohttp session.
+
+    Sessions are created per purpose (own headers/timeouts) but all reuse the
+    same connector, so TCP/TLS connections and DNS lookups are shared.
+    """
+
+    def __init__(self, limit: int = 64, limit_per_host: int = 16, keepalive_timeout: float = 75.0,
+                 dns_ttl: int = 300):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    def connector(self) -> aiohttp.TCPConnector:
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_ttl,
+                enable_cleanup_closed=True,
+            )
+            # sessions bound to the old connector are useless now
+            self._sessions.clear()
+        return self._connector
+
+    def session(self, name: str, timeout: float = 10, headers: Optional[Dict[str, str]] = None) -> aiohttp.ClientSession:
+        """Get or create the named session on the shared connector."""
+        connector = self.connector()
+        session = self._sessions.get(name)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=False,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            )
+            self._sessions[name] = session
+        return session
+
+    async def warm_up(self, urls: Iterable[str] = WARM_UP_URLS, timeout: float = 5):
+        """Open keep-alive TLS connections ahead of the first command."""
+        session = self.session("warmup", timeout=timeout)
+
+        async def _touch(url: str):
+            try:
+                async with session.head(url, allow_redirects=False) as resp:
+                    await resp.release()
+            except Exception as e:
+                logger.warning(f"Connection warm-up failed for {url}: {e}")
+
+        await asyncio.gather(*(_touch(url) for url in urls))
+
+    async def close(self):
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+
+
+_http_pool: Optional[HttpPool] = None
+
+def get_http_pool() -> HttpPool:
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HttpPool()
+    return _http_pool
@@ -1,8 +1,9 @@
 import os
-import json
 import logging
 import filelock
 
+from . import codec
+
 
 def safe_json_load(filepath: str, default: dict) -> dict:
     """Safely load JSON with file locking to prevent corruption."""
@@ -10,9 +11,9 @@ def safe_json_load(filepath: str, default: dict) -> dict:
     try:
         with lock:
             if os.path.exists(filepath):
-                with open(filepath, "r") as f:
-                    return json.load(f)
-    except (json.JSONDecodeError, filelock.Timeout, Exception) as e:
+                with open(filepath, "rb") as f:
+                    return codec.loads(f.read())
+    except (codec.JSONDecodeError, filelock.Timeout, Exception) as e:
         logging.getLogger('archie-bot').error(f"Failed to load {filepath}: {e}")
     return default
 
@@ -23,8 +24,8 @@ def safe_json_save(filepath: str, data: dict) -> bool:
     try:
         with lock:
             tmp_path = f"{filepath}.tmp"
-            with open(tmp_path, "w") as f:
-                json.dump(data, f)
+            with open(tmp_path, "wb") as f:
+                f.write(codec.dumps(data))
             os.replace(tmp_path, filepath)
             return True
     except (filelock.Timeout, Exception) as e:
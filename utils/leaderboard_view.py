@@ -0,0 +1,163 @@
+import math
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+import discord
+
+logger = logging.getLogger('archie-bot')
+
+# Entries requested per API call, and shown per embed page
+LEADERBOARD_FETCH_SIZE = 100
+LEADERBOARD_PAGE_SIZE = 10
+# Start fetching the next chunk once the user is this many pages from the end of what we have
+PREFETCH_PAGES_AHEAD = 2
+
+ChunkFetcher = Callable[[int], Awaitable[Optional[List[dict]]]]
+
+
+def leaderboard_entries(data, *keys: str) -> List[dict]:
+    """The entry list of a leaderboard response, under the first of `keys` that has one."""
+    if not isinstance(data, dict):
+        return []
+    for key in keys or ("entries",):
+        entries = data.get(key)
+        if isinstance(entries, list) and entries:
+            return entries
+    return []
+
+
+class LeaderboardPages:
+    """A leaderboard fetched `chunk_size` entries at a time and shown `page_size` at a time.
+
+    `fetch_chunk(n)` returns chunk n (page=n of the API at size=chunk_size);
+    leave it out for endpoints that return everything in one response.
+    """
+
+    def __init__(self, entries: List[dict], fetch_chunk: Optional[ChunkFetcher] = None,
+                 chunk_size: int = LEADERBOARD_FETCH_SIZE, page_size: int = LEADERBOARD_PAGE_SIZE):
+        self.entries = list(entries)
+        self.fetch_chunk = fetch_chunk
+        self.chunk_size = chunk_size
+        self.page_size = page_size
+        self.chunks_loaded = 1
+        self.exhausted = fetch_chunk is None or len(self.entries) < chunk_size
+        self._pending: Optional[asyncio.Task] = None
+
+    @property
+    def page_count(self) -> int:
+        return max(1, math.ceil(len(self.entries) / self.page_size))
+
+    def page(self, index: int) -> List[dict]:
+        start = index * self.page_size
+        return self.entries[start:start + self.page_size]
+
+    def prefetch_for(self, index: int):
+        """Start loading the next chunk in the background if page `index` is near the end."""
+        if self.exhausted or self._pending is not None:
+            return
+        if (index + 1 + PREFETCH_PAGES_AHEAD) * self.page_size >= len(self.entries):
+            self._pending = asyncio.create_task(self._load_next())
+
+    async def ensure(self, index: int):
+        """Make sure page `index` is loaded, if the leaderboard goes that far."""
+        while not self.exhausted and (index + 1) * self.page_size > len(self.entries):
+            if self._pending is None:
+                self._pending = asyncio.create_task(self._load_next())
+            await asyncio.shield(self._pending)
+
+    async def _load_next(self):
+        try:
+            chunk = await self.fetch_chunk(self.chunks_loaded)
+        except Exception as e:
+            logger.error(f"Failed to load leaderboard chunk {self.chunks_loaded}: {e}")
+            chunk = None
+        finally:
+            self._pending = None
+        if not chunk:
+            self.exhausted = True
+            return
+        self.entries.extend(chunk)
+        self.chunks_loaded += 1
+        if len(chunk) < self.chunk_size:
+            self.exhausted = True
+
+
+class LeaderboardView(discord.ui.View):
+    """Previous/next buttons over a LeaderboardPages.
+
+    `render(entries, start)` builds the embed for one page, where `start` is
+    the 0-based rank of its first entry. Only the user who ran the command
+    can turn pages.
+    """
+
+    def __init__(self, pages: LeaderboardPages, render: Callable[[List[dict], int], discord.Embed],
+                 author_id: int, timeout: float = 180):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.render = render
+        self.author_id = author_id
+        self.index = 0
+        self._update_buttons()
+
+    def embed(self) -> discord.Embed:
+        self.pages.prefetch_for(self.index)
+        return self.render(self.pages.page(self.index), self.index * self.pages.page_size)
+
+    def _update_buttons(self):
+        more = not self.pages.exhausted or self.index + 1 < self.pages.page_count
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = not more
+        self.page_label.label = f"{self.index + 1}/{self.pages.page_count}{'' if self.pages.exhausted else '+'}"
+
+    async def _show(self, interaction: discord.Interaction, index: int):
+        if self.pages.exhausted or (index + 1) * self.pages.page_size <= len(self.pages.entries):
+            self._move_to(index)
+            await interaction.response.edit_message(embed=self.embed(), view=self)
+            return
+        # The page needs a fetch, which can outlast Discord's 3s window: acknowledge first, edit after
+        await interaction.response.defer()
+        await self.pages.ensure(index)
+        self._move_to(index)
+        await interaction.edit_original_response(embed=self.embed(), view=self)
+
+    def _move_to(self, index: int):
+        self.index = max(0, min(index, self.pages.page_count - 1))
+        self._update_buttons()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user is None or interaction.user.id != self.author_id:
+            await interaction.response.send_message("Run the command yourself to browse this leaderboard.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, button: discord.ui.Button, interaction: discord.Interaction):
+        await self._show(interaction, self.index - 1)
+
+    @discord.ui.button(label="1/1", style=discord.ButtonStyle.secondary, disabled=True)
+    async def page_label(self, button: discord.ui.Button, interaction: discord.Interaction):
+        pass
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, button: discord.ui.Button, interaction: discord.Interaction):
+        await self._show(interaction, self.index + 1)
+
+    async def on_timeout(self):
+        self.disable_all_items()
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+
+async def respond_with_leaderboard(ctx: discord.ApplicationContext, pages: LeaderboardPages,
+                                   render: Callable[[List[dict], int], discord.Embed]):
+    """Send page 1 of a leaderboard, with buttons if there's more than one page."""
+    view = LeaderboardView(pages, render, ctx.author.id)
+    if pages.page_count == 1 and pages.exhausted:
+        await ctx.respond(embed=view.embed())
+        view.stop()
+        return
+    await ctx.respond(embed=view.embed(), view=view)
@@ -0,0 +1,145 @@
+import time
+import heapq
+import itertools
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .api_client import ApiError, BATCH_CONCURRENCY, get_cache_ttl
+from .deadline import Deadline
+from .leaderboard_view import LEADERBOARD_FETCH_SIZE, leaderboard_entries
+from .player_stats import parse_stat_id
+from .rate_limit import Priority
+
+logger = logging.getLogger('archie-bot')
+
+# Every kit with a ranked ELO leaderboard ("global" is the API's own aggregate, so it's left out)
+RANKED_ELO_KITS = (
+    "battlerush", "bedfight", "boxing", "bridges", "builduhc", "classic", "combo", "creeper_sumo",
+    "debuff", "fireballfight", "invaded", "nodebuff", "pearl", "soup", "spleef", "stickfight",
+    "sumo", "topfight",
+)
+RANKED_ELO_STAT_IDS = tuple(f"elo:{kit}:ranked:lifetime" for kit in RANKED_ELO_KITS)
+
+PathFor = Callable[[str, int], str]
+
+
+class MergedLeaderboard:
+    """One ranking over several leaderboards, built lazily with a k-way merge.
+
+    Each source leaderboard is read page by page, and a page is only
+    requested once the merge has consumed everything before it. Players
+    appear once, at their best value across the sources.
+
+    A source whose page can't be fetched drops out of the merge and is
+    listed in `failed_sources`; the rows are then `partial`, and such a
+    board is never reused by get_merged_leaderboard.
+    """
+
+    def __init__(self, client, stat_ids: Sequence[str], path_for: PathFor, page_size: int = LEADERBOARD_FETCH_SIZE):
+        self.client = client
+        self.stat_ids = tuple(stat_ids)
+        self.path_for = path_for
+        self.page_size = page_size
+        self.rows: List[dict] = []
+        self.pages_fetched = 0
+        self.created = time.monotonic()
+        self.exhausted = False
+        self._streams = [self._stream(stat_id) for stat_id in self.stat_ids]
+        self._heap: List[Tuple[float, int, int, dict]] = []
+        self._seen = set()
+        self._seq = itertools.count()
+        self._started = False
+        self.failed_sources: List[str] = []
+        self._priority = Priority.INTERACTIVE
+        self._deadline: Optional[Deadline] = None
+        # At most this many source pages in flight, so a merge can't eat the whole rate budget
+        self._semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        self._lock = asyncio.Lock()
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.failed_sources)
+
+    async def _stream(self, stat_id: str) -> AsyncIterator[dict]:
+        page = 0
+        while True:
+            async with self._semaphore:
+                data = await self.client.fetch(self.path_for(stat_id, page), self._priority, deadline=self._deadline)
+            self.pages_fetched += 1
+            entries = leaderboard_entries(data, "entries", "leaderboard")
+            for entry in entries:
+                yield entry
+            if len(entries) < self.page_size:
+                return
+            page += 1
+
+    async def _push_next(self, source: int):
+        """Move the next entry of a source onto the heap, fetching its next page if needed."""
+        try:
+            entry = await self._streams[source].__anext__()
+        except StopAsyncIteration:
+            return
+        except ApiError as e:
+            logger.warning(f"Merged leaderboard lost {self.stat_ids[source]}: {e}")
+            self.failed_sources.append(self.stat_ids[source])
+            return
+        value = entry.get("value", 0)
+        if not isinstance(value, (int, float)):
+            value = 0
+        # Ties keep the order the sources were given in
+        heapq.heappush(self._heap, (-value, source, next(self._seq), entry))
+
+    async def _extend(self, count: int):
+        if not self._started:
+            self._started = True
+            await asyncio.gather(*(self._push_next(source) for source in range(len(self._streams))))
+        while len(self.rows) < count and self._heap:
+            negative_value, source, _, entry = heapq.heappop(self._heap)
+            await self._push_next(source)
+            player = entry.get("uuid") or str(entry.get("username", "")).lower()
+            if not player or player in self._seen:
+                continue
+            self._seen.add(player)
+            stat_id = self.stat_ids[source]
+            self.rows.append({
+                "position": len(self.rows) + 1,
+                "username": entry.get("username", "Unknown"),
+                "uuid": entry.get("uuid"),
+                "value": -negative_value,
+                "statisticId": stat_id,
+                "kit": parse_stat_id(stat_id).mode,
+            })
+        if not self._heap:
+            self.exhausted = True
+
+    async def top(self, count: int, start: int = 0, priority: Priority = Priority.INTERACTIVE,
+                  deadline: Optional[Deadline] = None) -> List[dict]:
+        """Rows start..start+count of the merged ranking, merging further only if needed.
+
+        Raises ApiError if no source could be read at all.
+        """
+        async with self._lock:
+            if start + count > len(self.rows) and not self.exhausted:
+                self._priority = priority
+                self._deadline = deadline
+                await self._extend(start + count)
+            if not self.rows and len(self.failed_sources) == len(self.stat_ids):
+                raise ApiError("merged leaderboard: every source failed")
+        return self.rows[start:start + count]
+
+
+_merged: Dict[str, MergedLeaderboard] = {}
+
+def get_merged_leaderboard(client, name: str, stat_ids: Sequence[str], path_for: PathFor) -> MergedLeaderboard:
+    """The cached merged leaderboard `name`, rebuilt once its sources' cache TTL has passed.
+
+    A board that lost a source is rebuilt on the next call instead of being
+    served (incomplete) for the rest of the TTL.
+    """
+    ttl, _ = get_cache_ttl(path_for(stat_ids[0], 0)) or (0, 0)
+    board: Optional[MergedLeaderboard] = _merged.get(name)
+    if (board is None or board.client is not client or board.partial
+            or time.monotonic() - board.created >= ttl):
+        board = _merged[name] = MergedLeaderboard(client, stat_ids, path_for)
+    return board
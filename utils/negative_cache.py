@@ -0,0 +1,114 @@
+import hashlib
+import math
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+# Player lookups: /v1/<family>/username/<name>[/rest]
+PLAYER_PATH_REGEX = re.compile(r"^(?P<family>/v1/.+?)/username/(?P<name>[^/?]+)(?P<rest>[^?]*)")
+# Only these endpoints mean "no such player" when they 404. Sub-resources
+# like /statistics/{stat} can 404 for players that do exist, and other
+# families 404 for their own reasons (/v1/guilds/player: not in a guild)
+RECORDABLE_FAMILY_REGEX = re.compile(r"^/v1/(ugc/[^/]+/)?players$")
+RECORDABLE_RESTS = ("", "/statistics")
+# A 404 here means the name doesn't exist anywhere on the network, which
+# answers lookups in every other family too (/balance, /guild, ...)
+NETWORK_FAMILY = "/v1/players"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives, tunable false positives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class NegativeCache:
+    """Short-lived memory of "player not found" results, per player endpoint family.
+
+    A player missing from the network-wide family is missing from all of them.
+
+    Misses go into the current generation of a pair of Bloom filters; every
+    `ttl` seconds the older generation is dropped, so an entry is remembered
+    for between `ttl` and `2 * ttl` seconds. A full generation rotates early.
+    """
+
+    def __init__(self, ttl: float = 120.0, capacity: int = 50_000, error_rate: float = 0.001):
+        self.ttl = ttl
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous: Optional[BloomFilter] = None
+        self._rotated_at = time.monotonic()
+        self.hits = 0
+        self.recorded = 0
+
+    @staticmethod
+    def player_key(path: str) -> Optional[Tuple[str, str, str]]:
+        """Split a player lookup path into (family, lowercased username, rest)."""
+        match = PLAYER_PATH_REGEX.match(path)
+        if not match:
+            return None
+        return match["family"], match["name"].lower(), match["rest"]
+
+    def _rotate(self):
+        now = time.monotonic()
+        if now - self._rotated_at >= 2 * self.ttl:
+            self._previous = None
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = now
+        elif now - self._rotated_at >= self.ttl or self._current.count >= self.capacity:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = now
+
+    def is_missing(self, path: str) -> bool:
+        key = self.player_key(path)
+        if key is None:
+            return False
+        self._rotate()
+        family, name, _ = key
+        items = {f"{family}|{name}", f"{NETWORK_FAMILY}|{name}"}
+        for item in items:
+            if item in self._current or (self._previous is not None and item in self._previous):
+                self.hits += 1
+                return True
+        return False
+
+    def record(self, path: str):
+        key = self.player_key(path)
+        if key is None or key[2] not in RECORDABLE_RESTS or not RECORDABLE_FAMILY_REGEX.match(key[0]):
+            return
+        self._rotate()
+        self._current.add(f"{key[0]}|{key[1]}")
+        self.recorded += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "recorded": self.recorded,
+            "bytes": self._current.nbytes + (self._previous.nbytes if self._previous else 0),
+        }
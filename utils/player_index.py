@@ -0,0 +1,90 @@
+import os
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .json_ops import safe_json_load, safe_json_save
+
+PLAYER_INDEX_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "player_index.json")
+
+# Keys of API responses that hold lists of players (leaderboards, guild members, ...)
+PLAYER_LIST_KEYS = ("entries", "leaderboard", "players", "members", "clans", "guilds", "results")
+
+
+class PlayerIndex:
+    """Case-insensitive username -> UUID map, filled from every API response we see.
+
+    Kept in memory (LRU-bounded) and flushed to a JSON file now and then so
+    it survives restarts.
+    """
+
+    def __init__(self, path: str = PLAYER_INDEX_FILE, max_entries: int = 100_000, flush_interval: float = 60.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self._uuids: "OrderedDict[str, str]" = OrderedDict(safe_json_load(path, {}))
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def get_uuid(self, username: str) -> Optional[str]:
+        return self._uuids.get(username.lower())
+
+    def remember(self, username: Any, uuid: Any):
+        if not isinstance(username, str) or not isinstance(uuid, str) or not username or not uuid:
+            return
+        key = username.lower()
+        if self._uuids.get(key) != uuid:
+            self._uuids[key] = uuid
+            self._dirty = True
+        self._uuids.move_to_end(key)
+        while len(self._uuids) > self.max_entries:
+            self._uuids.popitem(last=False)
+
+    def observe(self, payload: Any):
+        """Record every (username, uuid) pair in an API response."""
+        if isinstance(payload, list):
+            for item in payload:
+                self._observe_one(item)
+        elif isinstance(payload, dict):
+            self._observe_one(payload)
+            for key in PLAYER_LIST_KEYS:
+                items = payload.get(key)
+                if isinstance(items, list):
+                    for item in items:
+                        self._observe_one(item)
+
+    def _observe_one(self, obj: Any):
+        if not isinstance(obj, dict):
+            return
+        self.remember(obj.get("username"), obj.get("uuid"))
+        self.remember(obj.get("leaderUsername"), obj.get("leaderUuid"))
+        members = obj.get("members")
+        if isinstance(members, list):
+            for member in members:
+                if isinstance(member, dict):
+                    self.remember(member.get("username"), member.get("uuid"))
+
+    def needs_flush(self) -> bool:
+        return self._dirty and time.monotonic() - self._saved_at >= self.flush_interval
+
+    async def flush(self) -> bool:
+        """Write the index to disk from a worker thread, if anything changed."""
+        if not self._dirty:
+            return True
+        snapshot = dict(self._uuids)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        return await asyncio.to_thread(safe_json_save, self.path, snapshot)
+
+    def __len__(self) -> int:
+        return len(self._uuids)
+
+
+_player_index: Optional[PlayerIndex] = None
+
+def get_player_index() -> PlayerIndex:
+    global _player_index
+    if _player_index is None:
+        _player_index = PlayerIndex()
+    return _player_index
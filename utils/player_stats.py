@@ -0,0 +1,172 @@
+import math
+import sys
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+
+class StatKey(NamedTuple):
+    """A statistic ID split into its parts, e.g. elo:nodebuff:ranked:lifetime."""
+    stat: str
+    mode: str = ""
+    queue: str = ""
+    period: str = ""
+
+
+@lru_cache(maxsize=4096)
+def parse_stat_id(stat_id: str) -> StatKey:
+    """Parse (and intern) a statistic ID. Lifesteal IDs like "kills" have only a stat part."""
+    parts = [sys.intern(p) for p in stat_id.split(":", 3)]
+    return StatKey(*parts)
+
+
+_NO_POSITION = -1
+_NO_PERCENTILE = math.nan
+
+
+class PlayerStats:
+    """Compact, indexed view of a player's statistics.
+
+    Values, positions, percentiles and totals live in parallel arrays, one
+    row per statistic; statistic IDs are parsed once into interned StatKeys
+    so queries like "all ranked ELOs" don't re-split 650 strings.
+    """
+    __slots__ = ("uuid", "username", "_rows", "_ids", "_keys", "_values", "_is_float",
+                 "_positions", "_percentiles", "_totals", "_by_part")
+
+    def __init__(self, uuid: str = "", username: str = ""):
+        self.uuid = uuid
+        self.username = username
+        self._rows: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._keys: List[StatKey] = []
+        self._values = array("d")
+        self._is_float = bytearray()
+        self._positions = array("q")
+        self._percentiles = array("d")
+        self._totals = array("q")
+        self._by_part: Optional[List[Dict[str, List[int]]]] = None
+
+    @classmethod
+    def from_payload(cls, data: Optional[dict]) -> "PlayerStats":
+        """Build from an API response with uuid, username and statistics."""
+        data = data or {}
+        return cls.from_statistics(data.get("statistics") or {}, data.get("uuid", ""), data.get("username", ""))
+
+    @classmethod
+    def from_statistics(cls, statistics: dict, uuid: str = "", username: str = "") -> "PlayerStats":
+        stats = cls(uuid, username)
+        for stat_id, stat in statistics.items():
+            stats._add(stat_id, stat)
+        return stats
+
+    @classmethod
+    def coerce(cls, statistics: Union["PlayerStats", dict, None]) -> "PlayerStats":
+        return statistics if isinstance(statistics, PlayerStats) else cls.from_statistics(statistics or {})
+
+    def _add(self, stat_id: str, stat: Any):
+        if isinstance(stat, dict):
+            value = stat.get("value")
+            position = stat.get("position")
+            percentile = stat.get("percentile")
+            total = stat.get("totalPlayers")
+        else:
+            value, position, percentile, total = stat, None, None, None
+        if not isinstance(value, (int, float)):
+            value = 0
+        if stat_id in self._rows:
+            return
+        self._rows[stat_id] = len(self._keys)
+        self._ids.append(stat_id)
+        self._keys.append(parse_stat_id(stat_id))
+        self._values.append(value)
+        self._is_float.append(isinstance(value, float))
+        self._positions.append(int(position) if position is not None else _NO_POSITION)
+        self._percentiles.append(float(percentile) if percentile is not None else _NO_PERCENTILE)
+        self._totals.append(int(total) if total is not None else _NO_POSITION)
+        self._by_part = None
+
+    def _value_at(self, row: int) -> Union[int, float]:
+        value = self._values[row]
+        return value if self._is_float[row] else int(value)
+
+    def value(self, stat_id: str, default: Union[int, float] = 0) -> Union[int, float]:
+        row = self._rows.get(stat_id)
+        return default if row is None else self._value_at(row)
+
+    def position(self, stat_id: str) -> Optional[int]:
+        row = self._rows.get(stat_id)
+        if row is None or self._positions[row] == _NO_POSITION:
+            return None
+        return self._positions[row]
+
+    def percentile(self, stat_id: str) -> Optional[float]:
+        row = self._rows.get(stat_id)
+        if row is None or math.isnan(self._percentiles[row]):
+            return None
+        return self._percentiles[row]
+
+    def total_players(self, stat_id: str) -> Optional[int]:
+        row = self._rows.get(stat_id)
+        if row is None or self._totals[row] == _NO_POSITION:
+            return None
+        return self._totals[row]
+
+    def get(self, stat_id: str) -> Optional[dict]:
+        """The statistic in the API's dict shape, or None."""
+        if stat_id not in self._rows:
+            return None
+        stat = {"statisticId": stat_id, "value": self.value(stat_id)}
+        for field, getter in (("position", self.position), ("percentile", self.percentile),
+                              ("totalPlayers", self.total_players)):
+            found = getter(stat_id)
+            if found is not None:
+                stat[field] = found
+        return stat
+
+    def _index(self) -> List[Dict[str, List[int]]]:
+        if self._by_part is None:
+            self._by_part = [{}, {}, {}, {}]
+            for row, key in enumerate(self._keys):
+                for part, index in zip(key, self._by_part):
+                    index.setdefault(part, []).append(row)
+        return self._by_part
+
+    def _select_rows(self, stat: Optional[str], mode: Optional[str], queue: Optional[str],
+                     period: Optional[str]) -> List[int]:
+        index = self._index()
+        candidates = None
+        for part, part_index in zip((stat, mode, queue, period), index):
+            if part is None:
+                continue
+            rows = part_index.get(part, [])
+            if candidates is None:
+                candidates = rows
+            else:
+                keep = set(rows)
+                candidates = [r for r in candidates if r in keep]
+        return list(range(len(self._keys))) if candidates is None else candidates
+
+    def select(self, stat: Optional[str] = None, mode: Optional[str] = None, queue: Optional[str] = None,
+               period: Optional[str] = None) -> Dict[str, Union[int, float]]:
+        """Values of every statistic matching the given parts, e.g. select(stat="elo", queue="ranked")."""
+        return {self._ids[row]: self._value_at(row) for row in self._select_rows(stat, mode, queue, period)}
+
+    def entries(self, stat: Optional[str] = None, mode: Optional[str] = None, queue: Optional[str] = None,
+                period: Optional[str] = None) -> Iterator[tuple]:
+        """Yield (StatKey, value, position) for every matching statistic."""
+        for row in self._select_rows(stat, mode, queue, period):
+            position = self._positions[row]
+            yield self._keys[row], self._value_at(row), (None if position == _NO_POSITION else position)
+
+    def ranked_elos(self) -> Dict[str, Union[int, float]]:
+        return self.select(stat="elo", queue="ranked")
+
+    def modes(self) -> List[str]:
+        return sorted(m for m in self._index()[1] if m)
+
+    def __contains__(self, stat_id: str) -> bool:
+        return stat_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,157 @@
+import math
+import time
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from . import api_client
+from .api_client import cache_key, get_api_client, get_cache_ttl
+from .rate_limit import Priority
+
+logger = logging.getLogger('archie-bot')
+
+# Share of the API rate budget the pre-warmer may spend
+PREWARM_BUDGET_SHARE = 0.25
+# Refresh a leaderboard once less than this fraction of its TTL is left
+REFRESH_AHEAD = 0.25
+# Request counts decay by half over this many seconds
+POPULARITY_HALF_LIFE = 6 * 3600
+# First pass after startup waits this long so it doesn't compete with command sync
+STARTUP_DELAY = 5.0
+# A board that keeps failing is retried after ttl * REFRESH_AHEAD, doubling per failure up to this
+MAX_RETRY_BACKOFF = 3600.0
+
+
+class _Board:
+    __slots__ = ("path", "score", "scored_at", "retry_at", "failures", "warmed", "skipped")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.score = 0.0
+        self.scored_at = time.monotonic()
+        self.retry_at = 0.0
+        self.failures = 0
+        self.warmed = 0
+        self.skipped = 0
+
+    def popularity(self, now: float) -> float:
+        return self.score * math.exp(-(now - self.scored_at) * math.log(2) / POPULARITY_HALF_LIFE)
+
+
+class LeaderboardPrewarmer:
+    """Keeps the fixed-choice leaderboards in the response cache.
+
+    Cogs register the exact paths their leaderboard commands request and
+    report each use. A background task refreshes whichever registered board
+    is closest to going stale, most-requested first, spacing requests so it
+    never uses more than `budget_share` of the rate limit. Requests go out at
+    PREFETCH priority, so interactive commands are always served first.
+    """
+
+    def __init__(self, budget_share: float = PREWARM_BUDGET_SHARE, refresh_ahead: float = REFRESH_AHEAD):
+        self.budget_share = budget_share
+        self.refresh_ahead = refresh_ahead
+        self._boards: Dict[str, _Board] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, *paths: str):
+        for path in paths:
+            if get_cache_ttl(path) is None:
+                logger.warning(f"Not pre-warming uncacheable path: {path}")
+                continue
+            self._boards.setdefault(path, _Board(path))
+
+    def record_use(self, path: str):
+        """Count a user request for a board, so popular boards are refreshed first."""
+        board = self._boards.get(path)
+        if board is None:
+            return
+        now = time.monotonic()
+        board.score = board.popularity(now) + 1
+        board.scored_at = now
+
+    def _spacing(self) -> float:
+        """Seconds between pre-warm requests, following the limiter's current rate."""
+        return 1.0 / max(1e-3, api_client.rate_limiter.rate * self.budget_share)
+
+    def _next_due(self, client) -> Tuple[Optional[_Board], float]:
+        """(board to refresh now or None, seconds until the next one is due)."""
+        now = time.monotonic()
+        best, best_rank = None, None
+        wait = math.inf
+        for board in self._boards.values():
+            if board.retry_at > now:
+                wait = min(wait, board.retry_at - now)
+                continue
+            ttl, _ = get_cache_ttl(board.path)
+            remaining = client.cache.expires_in(cache_key("GET", board.path))
+            lead = ttl * self.refresh_ahead
+            if remaining is not None and remaining > lead:
+                wait = min(wait, remaining - lead)
+                continue
+            # Most popular first; among equals, the one that's been cold longest
+            rank = (board.popularity(now), -remaining if remaining is not None else math.inf)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = board, rank
+        return best, 0.0 if best is not None else wait
+
+    async def _run(self):
+        await asyncio.sleep(STARTUP_DELAY)
+        client = get_api_client()
+        while True:
+            board, wait = self._next_due(client)
+            if board is None:
+                await asyncio.sleep(min(wait, 60.0))
+                continue
+            ttl, _ = get_cache_ttl(board.path)
+            try:
+                warmed = await client.prefetch(board.path, Priority.PREFETCH, ttl * self.refresh_ahead)
+            except Exception as e:
+                logger.error(f"Leaderboard pre-warm error for {board.path}: {e}")
+                warmed = False
+            if warmed:
+                board.warmed += 1
+                board.failures = 0
+            else:
+                # Failed, circuit open or already being refreshed: let the other boards go first,
+                # backing off further each time in a row so a dead board doesn't eat the budget
+                board.skipped += 1
+                board.failures += 1
+                backoff = ttl * self.refresh_ahead * 2 ** min(board.failures - 1, 16)
+                board.retry_at = time.monotonic() + min(backoff, MAX_RETRY_BACKOFF)
+            await asyncio.sleep(self._spacing())
+
+    def start(self):
+        """Start the background refresher (no-op if it's already running)."""
+        if self._task is None or self._task.done():
+            logger.info(f"Pre-warming {len(self._boards)} leaderboards")
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "boards": len(self._boards),
+            "running": self._task is not None and not self._task.done(),
+            "spacing": round(self._spacing(), 2),
+            "warmed": sum(b.warmed for b in self._boards.values()),
+            "skipped": sum(b.skipped for b in self._boards.values()),
+            "popular": [b.path for b in sorted(self._boards.values(), key=lambda b: -b.popularity(now))[:5]],
+        }
+
+
+_prewarmer: Optional[LeaderboardPrewarmer] = None
+
+def get_prewarmer() -> LeaderboardPrewarmer:
+    global _prewarmer
+    if _prewarmer is None:
+        _prewarmer = LeaderboardPrewarmer()
+    return _prewarmer
@@ -0,0 +1,221 @@
+import asyncio
+import heapq
+import itertools
+import time
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Lower value is served first."""
+    INTERACTIVE = 0
+    PREFETCH = 1
+    BACKGROUND = 2
+
+
+# Longest a caller of each priority will queue for a token before giving up
+DEFAULT_MAX_WAIT = {
+    Priority.INTERACTIVE: 10.0,
+    Priority.PREFETCH: 30.0,
+    Priority.BACKGROUND: 60.0,
+}
+
+
+# Fraction of an advertised upstream limit we allow ourselves to use
+HEADER_LIMIT_HEADROOM = 0.9
+# Rate is cut by this factor on every 429, then recovers additively on success
+BACKOFF_FACTOR = 0.75
+RECOVERY_PER_SUCCESS = 0.5 / 60.0
+MIN_RATE_PER_MINUTE = 10
+DEFAULT_RETRY_AFTER = 5.0
+MAX_PAUSE = 120.0
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds from now."""
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    if value:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit reset header (delta seconds or epoch seconds/ms) into seconds from now."""
+    reset = _parse_float(value)
+    if reset is None:
+        return None
+    if reset > 1e12:
+        reset /= 1000.0
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+class TokenBucketLimiter:
+    """Token bucket that queues callers by priority instead of rejecting them.
+
+    Over any rolling minute at most `burst + rate_per_minute` requests are let
+    through, so keep the sum under the upstream limit. The rate adapts to
+    rate-limit headers and 429 responses reported through `observe`.
+    """
+
+    def __init__(self, rate_per_minute: float = 90, burst: int = 10):
+        self.rate = rate_per_minute / 60.0
+        self.max_rate = self.rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self.upstream_limit: Optional[int] = None
+        self.upstream_remaining: Optional[int] = None
+        self.throttled = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self.queued = 0
+        self.max_queued = 0
+        self.granted = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._waits_by_priority: Dict[Priority, List[float]] = {p: [0, 0.0] for p in Priority}
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """Wait for a token. Returns False if none was granted within `timeout`."""
+        if timeout is None:
+            timeout = DEFAULT_MAX_WAIT[priority]
+        self._refill()
+        if not self._waiters and self._tokens >= 1 and not self._paused():
+            self._tokens -= 1
+            self._record(priority, 0.0)
+            return True
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return False
+        finally:
+            self.queued -= 1
+        self._record(priority, time.monotonic() - started)
+        return True
+
+    async def _dispatch(self):
+        """Hand out tokens to queued callers, highest priority first, as they refill."""
+        while self._waiters:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            self._refill()
+            while self._waiters and self._tokens >= 1:
+                _, _, fut = heapq.heappop(self._waiters)
+                if fut.done():
+                    continue
+                self._tokens -= 1
+                fut.set_result(True)
+            while self._waiters and self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+            if not self._waiters:
+                break
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def _paused(self) -> bool:
+        return time.monotonic() < self._paused_until
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` (extends, never shortens, a pause)."""
+        seconds = min(seconds, MAX_PAUSE)
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def observe(self, status: int, headers: Mapping[str, str]):
+        """Adapt the budget to an upstream response's status and rate-limit headers."""
+        limit = _parse_float(headers.get("X-RateLimit-Limit") or headers.get("RateLimit-Limit"))
+        remaining = _parse_float(headers.get("X-RateLimit-Remaining") or headers.get("RateLimit-Remaining"))
+        reset = parse_reset(headers.get("X-RateLimit-Reset") or headers.get("RateLimit-Reset"))
+
+        if limit is not None and limit > 0:
+            self.upstream_limit = int(limit)
+            self.max_rate = max(MIN_RATE_PER_MINUTE, limit * HEADER_LIMIT_HEADROOM) / 60.0
+            self.rate = min(self.rate, self.max_rate)
+        if remaining is not None:
+            self.upstream_remaining = int(remaining)
+            # never hold more tokens than the server says we have left
+            self._refill()
+            self._tokens = min(self._tokens, max(0.0, remaining))
+            if remaining <= 0 and reset:
+                self.pause(reset)
+
+        if status == 429:
+            self.throttled += 1
+            self.rate = max(MIN_RATE_PER_MINUTE / 60.0, self.rate * BACKOFF_FACTOR)
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            self.pause(retry_after if retry_after is not None else (reset or DEFAULT_RETRY_AFTER))
+        elif status < 400 and self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + RECOVERY_PER_SUCCESS)
+
+    def estimate(self) -> Dict[str, Any]:
+        """Current view of the budget: our rate, the upstream ceiling and how close we are to it."""
+        self._refill()
+        return {
+            "rate_per_minute": round(self.rate * 60, 1),
+            "max_rate_per_minute": round(self.max_rate * 60, 1),
+            "tokens": round(self._tokens, 2),
+            "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 2),
+            "upstream_limit": self.upstream_limit,
+            "upstream_remaining": self.upstream_remaining,
+            "throttled": self.throttled,
+        }
+
+    def _record(self, priority: Priority, waited: float):
+        self.granted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        bucket = self._waits_by_priority[priority]
+        bucket[0] += 1
+        bucket[1] += waited
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.estimate(),
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "granted": self.granted,
+            "timeouts": self.timeouts,
+            "avg_wait": self.total_wait / self.granted if self.granted else 0.0,
+            "max_wait": self.max_wait,
+            "avg_wait_by_priority": {
+                p.name.lower(): (total / count if count else 0.0)
+                for p, (count, total) in self._waits_by_priority.items()
+            },
+        }
@@ -0,0 +1,99 @@
+import random
+import time
+from typing import Any, Dict
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for idempotent requests, bounded by a per-call deadline."""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 4.0,
+                 attempt_timeout: float = 8.0, deadline: float = 15.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempt_timeout = attempt_timeout
+        self.deadline = deadline
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def is_retryable_status(status: int) -> bool:
+        return 500 <= status < 600
+
+
+class CircuitBreaker:
+    """Opens after repeated failed calls so callers fail fast until the backend recovers.
+
+    A call counts once, after its retries: callers check `allow()` before
+    the first attempt and record a single outcome at the end.
+
+    After `reset_timeout` seconds one trial request is let through (half-open);
+    its outcome closes the breaker again or re-opens it.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+
+    def is_open(self) -> bool:
+        """True while calls are being rejected outright (before the half-open trial)."""
+        return self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        # a trial that never reported back (e.g. cancelled) doesn't block forever
+        if self.state == self.HALF_OPEN and (not self._trial_in_flight or now - self._trial_started >= self.reset_timeout):
+            self._trial_in_flight = True
+            self._trial_started = now
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self):
+        """Give back a half-open trial that ended without a verdict on the backend."""
+        self._trial_in_flight = False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+def route_family(path: str) -> str:
+    """Group an API path by backend, e.g. /v1/ugc/... -> "ugc", /v1/players/... -> "players"."""
+    parts = path.split("?", 1)[0].split("/")
+    return parts[2] if len(parts) > 2 and parts[2] else "default"
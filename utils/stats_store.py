@@ -0,0 +1,84 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .player_stats import PlayerStats
+
+
+class _StoredStats:
+    __slots__ = ("stats", "fetched_at", "expires_at", "stale_until")
+
+    def __init__(self, stats: PlayerStats, fetched_at: float, expires_at: float, stale_until: float):
+        self.stats = stats
+        self.fetched_at = fetched_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class PlayerStatsStore:
+    """Decoded network-wide statistics per player, shared by every command that reads them.
+
+    Keyed by lowercased username, so "Steve" and "steve" are one entry.
+    Each entry carries the freshness of the API response it came from;
+    LRU-bounded, and entries past their stale window are dropped.
+    """
+
+    def __init__(self, max_players: int = 256):
+        self.max_players = max_players
+        self._entries: "OrderedDict[str, _StoredStats]" = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, username: str) -> Optional[PlayerStats]:
+        """Fresh statistics for a player, or None."""
+        entry = self._entries.get(username.lower())
+        if entry is None or time.monotonic() >= entry.expires_at:
+            if entry is not None:
+                self.stale_hits += 1
+            else:
+                self.misses += 1
+            return None
+        self._entries.move_to_end(username.lower())
+        self.hits += 1
+        return entry.stats
+
+    def peek(self, username: str) -> Optional[PlayerStats]:
+        """Statistics for a player within their stale window, without touching counters."""
+        entry = self._entries.get(username.lower())
+        if entry is None or time.monotonic() >= entry.stale_until:
+            return None
+        return entry.stats
+
+    def age(self, username: str) -> Optional[float]:
+        """Seconds since a player's stored statistics were fetched from the API, or None."""
+        entry = self._entries.get(username.lower())
+        return None if entry is None else time.monotonic() - entry.fetched_at
+
+    def put(self, username: str, stats: PlayerStats, fresh_for: float, stale_for: float = 0, age: float = 0):
+        """Store statistics that stay fresh for `fresh_for` seconds and were fetched `age` seconds ago."""
+        now = time.monotonic()
+        entry = _StoredStats(stats, now - age, now + fresh_for, now + fresh_for + stale_for)
+        for name in {username.lower(), stats.username.lower()} - {""}:
+            self._entries[name] = entry
+            self._entries.move_to_end(name)
+        if len(self._entries) > self.max_players:
+            self.prune()
+        while len(self._entries) > self.max_players:
+            self._entries.popitem(last=False)
+
+    def prune(self):
+        now = time.monotonic()
+        for name in [name for name, entry in self._entries.items() if now >= entry.stale_until]:
+            del self._entries[name]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "players": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }